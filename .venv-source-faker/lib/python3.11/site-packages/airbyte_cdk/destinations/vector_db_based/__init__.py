@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+from .config import (
+    AzureOpenAIEmbeddingConfigModel,
+    CohereEmbeddingConfigModel,
+    FakeEmbeddingConfigModel,
+    FromFieldEmbeddingConfigModel,
+    OpenAICompatibleEmbeddingConfigModel,
+    OpenAIEmbeddingConfigModel,
+    ProcessingConfigModel,
+)
+from .document_processor import Chunk, DocumentProcessor
+from .embedder import CohereEmbedder, Embedder, FakeEmbedder, OpenAIEmbedder
+from .indexer import Indexer
+from .writer import Writer
+
+__all__ = [
+    "AzureOpenAIEmbedder",
+    "AzureOpenAIEmbeddingConfigModel",
+    "Chunk",
+    "CohereEmbedder",
+    "CohereEmbeddingConfigModel",
+    "DocumentProcessor",
+    "Embedder",
+    "FakeEmbedder",
+    "FakeEmbeddingConfigModel",
+    "FromFieldEmbedder",
+    "FromFieldEmbeddingConfigModel",
+    "Indexer",
+    "OpenAICompatibleEmbedder",
+    "OpenAICompatibleEmbeddingConfigModel",
+    "OpenAIEmbedder",
+    "OpenAIEmbeddingConfigModel",
+    "ProcessingConfigModel",
+    "Writer",
+]
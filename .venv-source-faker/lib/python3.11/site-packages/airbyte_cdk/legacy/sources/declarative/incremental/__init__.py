@@ -0,0 +1 @@
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
@@ -0,0 +1,19 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.manifest_migrations.migrations.http_requester_path_to_url import (
+    HttpRequesterPathToUrl,
+)
+from airbyte_cdk.manifest_migrations.migrations.http_requester_request_body_json_data_to_request_body import (
+    HttpRequesterRequestBodyJsonDataToRequestBody,
+)
+from airbyte_cdk.manifest_migrations.migrations.http_requester_url_base_to_url import (
+    HttpRequesterUrlBaseToUrl,
+)
+
+__all__ = [
+    "HttpRequesterPathToUrl",
+    "HttpRequesterRequestBodyJsonDataToRequestBody",
+    "HttpRequesterUrlBaseToUrl",
+]
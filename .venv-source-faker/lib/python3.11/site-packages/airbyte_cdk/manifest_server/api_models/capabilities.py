@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class CapabilitiesResponse(BaseModel):
+    """Capabilities of the manifest server."""
+
+    custom_code_execution: bool
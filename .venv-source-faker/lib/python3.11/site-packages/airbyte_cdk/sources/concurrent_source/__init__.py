@@ -0,0 +1,8 @@
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+"""The concurrent source model replaces the legacy Source model.
+
+The concurrent source model is a new way to build sources in the Airbyte CDK. It is designed to
+be more ergonomic and performant than the legacy Source model.
+
+To implement a source using the concurrent source model, check out the submodules in this package.
+"""
@@ -0,0 +1,33 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.decoders.composite_raw_decoder import (
+    CompositeRawDecoder,
+    GzipParser,
+    JsonParser,
+    Parser,
+)
+from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
+from airbyte_cdk.sources.declarative.decoders.json_decoder import (
+    IterableDecoder,
+    JsonDecoder,
+)
+from airbyte_cdk.sources.declarative.decoders.noop_decoder import NoopDecoder
+from airbyte_cdk.sources.declarative.decoders.pagination_decoder_decorator import (
+    PaginationDecoderDecorator,
+)
+from airbyte_cdk.sources.declarative.decoders.xml_decoder import XmlDecoder
+from airbyte_cdk.sources.declarative.decoders.zipfile_decoder import ZipfileDecoder
+
+__all__ = [
+    "Decoder",
+    "CompositeRawDecoder",
+    "JsonDecoder",
+    "JsonParser",
+    "IterableDecoder",
+    "NoopDecoder",
+    "PaginationDecoderDecorator",
+    "XmlDecoder",
+    "ZipfileDecoder",
+]
@@ -0,0 +1,2 @@
+# generated by bin/generate_component_manifest_files.py
+from .declarative_component_schema import *
@@ -0,0 +1,25 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import (
+    CursorPaginationStrategy,
+)
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import (
+    OffsetIncrement,
+)
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import (
+    PageIncrement,
+)
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.stop_condition import (
+    CursorStopCondition,
+    StopConditionPaginationStrategyDecorator,
+)
+
+__all__ = [
+    "CursorPaginationStrategy",
+    "CursorStopCondition",
+    "OffsetIncrement",
+    "PageIncrement",
+    "StopConditionPaginationStrategyDecorator",
+]
@@ -0,0 +1,17 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.retrievers.async_retriever import AsyncRetriever
+from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import (
+    LazySimpleRetriever,
+    SimpleRetriever,
+)
+
+__all__ = [
+    "Retriever",
+    "SimpleRetriever",
+    "AsyncRetriever",
+    "LazySimpleRetriever",
+]
@@ -0,0 +1,15 @@
+from .connector_builder_file_uploader import ConnectorBuilderFileUploader
+from .default_file_uploader import DefaultFileUploader
+from .file_uploader import FileUploader
+from .file_writer import FileWriter
+from .local_file_system_file_writer import LocalFileSystemFileWriter
+from .noop_file_writer import NoopFileWriter
+
+__all__ = [
+    "DefaultFileUploader",
+    "LocalFileSystemFileWriter",
+    "NoopFileWriter",
+    "ConnectorBuilderFileUploader",
+    "FileUploader",
+    "FileWriter",
+]
@@ -0,0 +1,7 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.spec.spec import ConfigMigration, Spec
+
+__all__ = ["Spec", "ConfigMigration"]
@@ -0,0 +1,9 @@
+#
+# Copyright (c) 2025 Airbyte, Inc., all rights reserved.
+#
+
+from .add_fields import ConfigAddFields
+from .remap_field import ConfigRemapField
+from .remove_fields import ConfigRemoveFields
+
+__all__ = ["ConfigRemapField", "ConfigAddFields", "ConfigRemoveFields"]
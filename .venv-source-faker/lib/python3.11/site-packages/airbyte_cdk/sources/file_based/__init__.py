@@ -0,0 +1,24 @@
+from .config.abstract_file_based_spec import AbstractFileBasedSpec
+from .config.csv_format import CsvFormat
+from .config.file_based_stream_config import FileBasedStreamConfig
+from .config.jsonl_format import JsonlFormat
+from .exceptions import CustomFileBasedException, ErrorListingFiles, FileBasedSourceError
+from .file_based_source import DEFAULT_CONCURRENCY, FileBasedSource
+from .file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
+from .remote_file import RemoteFile
+from .stream.cursor import DefaultFileBasedCursor
+
+__all__ = [
+    "AbstractFileBasedSpec",
+    "AbstractFileBasedStreamReader",
+    "CsvFormat",
+    "CustomFileBasedException",
+    "DefaultFileBasedCursor",
+    "ErrorListingFiles",
+    "FileBasedSource",
+    "FileBasedSourceError",
+    "FileBasedStreamConfig",
+    "FileReadMode",
+    "JsonlFormat",
+    "RemoteFile",
+]
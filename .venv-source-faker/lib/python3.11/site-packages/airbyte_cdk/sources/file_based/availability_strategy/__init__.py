@@ -0,0 +1,7 @@
+from .abstract_file_based_availability_strategy import AbstractFileBasedAvailabilityStrategy
+from .default_file_based_availability_strategy import DefaultFileBasedAvailabilityStrategy
+
+__all__ = [
+    "AbstractFileBasedAvailabilityStrategy",
+    "DefaultFileBasedAvailabilityStrategy",
+]
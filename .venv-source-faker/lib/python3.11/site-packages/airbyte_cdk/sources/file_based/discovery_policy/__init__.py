@@ -0,0 +1,8 @@
+from airbyte_cdk.sources.file_based.discovery_policy.abstract_discovery_policy import (
+    AbstractDiscoveryPolicy,
+)
+from airbyte_cdk.sources.file_based.discovery_policy.default_discovery_policy import (
+    DefaultDiscoveryPolicy,
+)
+
+__all__ = ["AbstractDiscoveryPolicy", "DefaultDiscoveryPolicy"]
@@ -0,0 +1,17 @@
+from airbyte_cdk.sources.file_based.schema_validation_policies.abstract_schema_validation_policy import (
+    AbstractSchemaValidationPolicy,
+)
+from airbyte_cdk.sources.file_based.schema_validation_policies.default_schema_validation_policies import (
+    DEFAULT_SCHEMA_VALIDATION_POLICIES,
+    EmitRecordPolicy,
+    SkipRecordPolicy,
+    WaitForDiscoverPolicy,
+)
+
+__all__ = [
+    "DEFAULT_SCHEMA_VALIDATION_POLICIES",
+    "AbstractSchemaValidationPolicy",
+    "EmitRecordPolicy",
+    "SkipRecordPolicy",
+    "WaitForDiscoverPolicy",
+]
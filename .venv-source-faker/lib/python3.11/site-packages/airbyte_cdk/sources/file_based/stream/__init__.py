@@ -0,0 +1,13 @@
+from airbyte_cdk.sources.file_based.stream.abstract_file_based_stream import AbstractFileBasedStream
+from airbyte_cdk.sources.file_based.stream.default_file_based_stream import DefaultFileBasedStream
+from airbyte_cdk.sources.file_based.stream.identities_stream import FileIdentitiesStream
+from airbyte_cdk.sources.file_based.stream.permissions_file_based_stream import (
+    PermissionsFileBasedStream,
+)
+
+__all__ = [
+    "AbstractFileBasedStream",
+    "DefaultFileBasedStream",
+    "FileIdentitiesStream",
+    "PermissionsFileBasedStream",
+]
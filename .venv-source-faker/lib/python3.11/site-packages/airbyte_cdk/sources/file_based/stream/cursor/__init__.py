@@ -0,0 +1,4 @@
+from .abstract_file_based_cursor import AbstractFileBasedCursor
+from .default_file_based_cursor import DefaultFileBasedCursor
+
+__all__ = ["AbstractFileBasedCursor", "DefaultFileBasedCursor"]
@@ -0,0 +1,19 @@
+#
+# Copyright (c) 2021 Airbyte, Inc., all rights reserved.
+#
+
+from .repository import (
+    InMemoryMessageRepository,
+    LogAppenderMessageRepositoryDecorator,
+    LogMessage,
+    MessageRepository,
+    NoopMessageRepository,
+)
+
+__all__ = [
+    "InMemoryMessageRepository",
+    "LogAppenderMessageRepositoryDecorator",
+    "LogMessage",
+    "MessageRepository",
+    "NoopMessageRepository",
+]
@@ -0,0 +1,26 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+from .checkpoint_reader import (
+    CheckpointMode,
+    CheckpointReader,
+    CursorBasedCheckpointReader,
+    FullRefreshCheckpointReader,
+    IncrementalCheckpointReader,
+    LegacyCursorBasedCheckpointReader,
+    ResumableFullRefreshCheckpointReader,
+)
+from .cursor import Cursor
+from .resumable_full_refresh_cursor import ResumableFullRefreshCursor
+
+__all__ = [
+    "CheckpointMode",
+    "CheckpointReader",
+    "Cursor",
+    "CursorBasedCheckpointReader",
+    "FullRefreshCheckpointReader",
+    "IncrementalCheckpointReader",
+    "LegacyCursorBasedCheckpointReader",
+    "ResumableFullRefreshCheckpointReader",
+    "ResumableFullRefreshCursor",
+]
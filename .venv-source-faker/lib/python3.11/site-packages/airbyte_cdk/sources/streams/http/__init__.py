@@ -0,0 +1,10 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+# Initialize Streams Package
+from .exceptions import UserDefinedBackoffException
+from .http import HttpStream, HttpSubStream
+from .http_client import HttpClient
+
+__all__ = ["HttpClient", "HttpStream", "HttpSubStream", "UserDefinedBackoffException"]
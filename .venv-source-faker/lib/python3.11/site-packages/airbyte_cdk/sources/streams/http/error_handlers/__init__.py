@@ -0,0 +1,22 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from .backoff_strategy import BackoffStrategy
+from .default_backoff_strategy import DefaultBackoffStrategy
+from .error_handler import ErrorHandler
+from .error_message_parser import ErrorMessageParser
+from .http_status_error_handler import HttpStatusErrorHandler
+from .json_error_message_parser import JsonErrorMessageParser
+from .response_models import ErrorResolution, ResponseAction
+
+__all__ = [
+    "BackoffStrategy",
+    "DefaultBackoffStrategy",
+    "ErrorHandler",
+    "ErrorMessageParser",
+    "HttpStatusErrorHandler",
+    "JsonErrorMessageParser",
+    "ResponseAction",
+    "ErrorResolution",
+]
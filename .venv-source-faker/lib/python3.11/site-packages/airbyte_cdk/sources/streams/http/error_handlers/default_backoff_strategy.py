@@ -0,0 +1,17 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
+
+
+from typing import Optional, Union
+
+import requests
+
+from .backoff_strategy import BackoffStrategy
+
+
+class DefaultBackoffStrategy(BackoffStrategy):
+    def backoff_time(
+        self,
+        response_or_exception: Optional[Union[requests.Response, requests.RequestException]],
+        attempt_count: int,
+    ) -> Optional[float]:
+        return None
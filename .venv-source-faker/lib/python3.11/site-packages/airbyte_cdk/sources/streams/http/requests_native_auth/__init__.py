@@ -0,0 +1,14 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from .oauth import Oauth2Authenticator, SingleUseRefreshTokenOauth2Authenticator
+from .token import BasicHttpAuthenticator, MultipleTokenAuthenticator, TokenAuthenticator
+
+__all__ = [
+    "Oauth2Authenticator",
+    "SingleUseRefreshTokenOauth2Authenticator",
+    "TokenAuthenticator",
+    "MultipleTokenAuthenticator",
+    "BasicHttpAuthenticator",
+]
@@ -0,0 +1,7 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+This package is provided as tooling to help sources test their implementation. It is not expected to be used as production code.
+"""
@@ -0,0 +1,6 @@
+from airbyte_cdk.test.mock_http.matcher import HttpRequestMatcher
+from airbyte_cdk.test.mock_http.mocker import HttpMocker
+from airbyte_cdk.test.mock_http.request import HttpRequest
+from airbyte_cdk.test.mock_http.response import HttpResponse
+
+__all__ = ["HttpMocker", "HttpRequest", "HttpRequestMatcher", "HttpResponse"]
@@ -0,0 +1 @@
+# Copyright (c) 2024 Airbyte, Inc., all rights reserved.
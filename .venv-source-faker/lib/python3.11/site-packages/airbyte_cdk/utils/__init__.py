@@ -0,0 +1,10 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from .is_cloud_environment import is_cloud_environment
+from .print_buffer import PrintBuffer
+from .schema_inferrer import SchemaInferrer
+from .traced_exception import AirbyteTracedException
+
+__all__ = ["AirbyteTracedException", "SchemaInferrer", "is_cloud_environment", "PrintBuffer"]
@@ -0,0 +1,4 @@
+# generated by generate-python-dataclasses
+name = 'models'
+from .well_known_types import *
+from .airbyte_protocol import *
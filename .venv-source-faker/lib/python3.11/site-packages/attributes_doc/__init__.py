@@ -0,0 +1,9 @@
+from ._base import FStringFound, attributes_doc, enum_doc, get_attributes_doc, get_doc
+
+__all__ = [
+    "FStringFound",
+    "attributes_doc",
+    "enum_doc",
+    "get_attributes_doc",
+    "get_doc",
+]
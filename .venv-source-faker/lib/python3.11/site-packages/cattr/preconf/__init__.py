@@ -0,0 +1,3 @@
+from cattrs.preconf import validate_datetime
+
+__all__ = ["validate_datetime"]
@@ -0,0 +1,169 @@
+info = {
+    "name": "asa",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januari"
+    ],
+    "february": [
+        "feb",
+        "februari"
+    ],
+    "march": [
+        "mac",
+        "machi"
+    ],
+    "april": [
+        "apr",
+        "aprili"
+    ],
+    "may": [
+        "mei"
+    ],
+    "june": [
+        "jun",
+        "juni"
+    ],
+    "july": [
+        "jul",
+        "julai"
+    ],
+    "august": [
+        "ago",
+        "agosti"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "dec",
+        "desemba"
+    ],
+    "monday": [
+        "jtt",
+        "jumatatu"
+    ],
+    "tuesday": [
+        "jnn",
+        "jumanne"
+    ],
+    "wednesday": [
+        "jtn",
+        "jumatano"
+    ],
+    "thursday": [
+        "alh",
+        "alhamisi"
+    ],
+    "friday": [
+        "ijm",
+        "ijumaa"
+    ],
+    "saturday": [
+        "jmo",
+        "jumamosi"
+    ],
+    "sunday": [
+        "jpi",
+        "jumapili"
+    ],
+    "am": [
+        "icheheavo"
+    ],
+    "pm": [
+        "ichamthi"
+    ],
+    "year": [
+        "mwaka"
+    ],
+    "month": [
+        "mweji"
+    ],
+    "week": [
+        "ndisha"
+    ],
+    "day": [
+        "thiku"
+    ],
+    "hour": [
+        "hr",
+        "thaa"
+    ],
+    "minute": [
+        "dakika"
+    ],
+    "second": [
+        "thekunde"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "iyoo"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "ighuo"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "yavo"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,169 @@
+info = {
+    "name": "az-Cyrl",
+    "date_order": "DMY",
+    "january": [
+        "јан",
+        "јанвар"
+    ],
+    "february": [
+        "фев",
+        "феврал"
+    ],
+    "march": [
+        "мар",
+        "март"
+    ],
+    "april": [
+        "апр",
+        "апрел"
+    ],
+    "may": [
+        "май"
+    ],
+    "june": [
+        "ијн",
+        "ијун"
+    ],
+    "july": [
+        "ијл",
+        "ијул"
+    ],
+    "august": [
+        "авг",
+        "август"
+    ],
+    "september": [
+        "сен",
+        "сентјабр"
+    ],
+    "october": [
+        "окт",
+        "октјабр"
+    ],
+    "november": [
+        "ној",
+        "нојабр"
+    ],
+    "december": [
+        "дек",
+        "декабр"
+    ],
+    "monday": [
+        "базар ертәси",
+        "бе"
+    ],
+    "tuesday": [
+        "ча",
+        "чәршәнбә ахшамы"
+    ],
+    "wednesday": [
+        "ч",
+        "чәршәнбә"
+    ],
+    "thursday": [
+        "ҹа",
+        "ҹүмә ахшамы"
+    ],
+    "friday": [
+        "ҹ",
+        "ҹүмә"
+    ],
+    "saturday": [
+        "ш",
+        "шәнбә"
+    ],
+    "sunday": [
+        "б",
+        "базар"
+    ],
+    "am": [
+        "ам"
+    ],
+    "pm": [
+        "пм"
+    ],
+    "year": [
+        "year"
+    ],
+    "month": [
+        "month"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "day"
+    ],
+    "hour": [
+        "hour",
+        "hr"
+    ],
+    "minute": [
+        "minute"
+    ],
+    "second": [
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "today"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "yesterday"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
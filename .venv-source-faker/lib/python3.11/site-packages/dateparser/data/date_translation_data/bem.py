@@ -0,0 +1,162 @@
+info = {
+    "name": "bem",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januari"
+    ],
+    "february": [
+        "feb",
+        "februari"
+    ],
+    "march": [
+        "mac",
+        "machi"
+    ],
+    "april": [
+        "epr",
+        "epreo"
+    ],
+    "may": [
+        "mei"
+    ],
+    "june": [
+        "jun",
+        "juni"
+    ],
+    "july": [
+        "jul",
+        "julai"
+    ],
+    "august": [
+        "oga",
+        "ogasti"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "dis",
+        "disemba"
+    ],
+    "monday": [
+        "palichimo"
+    ],
+    "tuesday": [
+        "palichibuli"
+    ],
+    "wednesday": [
+        "palichitatu"
+    ],
+    "thursday": [
+        "palichine"
+    ],
+    "friday": [
+        "palichisano"
+    ],
+    "saturday": [
+        "pachibelushi"
+    ],
+    "sunday": [
+        "pa mulungu"
+    ],
+    "am": [
+        "uluchelo"
+    ],
+    "pm": [
+        "akasuba"
+    ],
+    "year": [
+        "umwaka"
+    ],
+    "month": [
+        "umweshi"
+    ],
+    "week": [
+        "umulungu"
+    ],
+    "day": [
+        "ubushiku"
+    ],
+    "hour": [
+        "hr",
+        "insa"
+    ],
+    "minute": [
+        "mineti"
+    ],
+    "second": [
+        "sekondi"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "lelo"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "yesterday"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
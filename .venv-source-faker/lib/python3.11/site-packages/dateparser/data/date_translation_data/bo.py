@@ -0,0 +1,186 @@
+info = {
+    "name": "bo",
+    "date_order": "YMD",
+    "january": [
+        "ཟླ་༡",
+        "ཟླ་བ་དང་པོ",
+        "ཟླ་བ་དང་པོ་"
+    ],
+    "february": [
+        "ཟླ་༢",
+        "ཟླ་བ་གཉིས་པ",
+        "ཟླ་བ་གཉིས་པ་"
+    ],
+    "march": [
+        "ཟླ་༣",
+        "ཟླ་བ་གསུམ་པ",
+        "ཟླ་བ་གསུམ་པ་"
+    ],
+    "april": [
+        "ཟླ་༤",
+        "ཟླ་བ་བཞི་པ",
+        "ཟླ་བ་བཞི་པ་"
+    ],
+    "may": [
+        "ཟླ་༥",
+        "ཟླ་བ་ལྔ་པ",
+        "ཟླ་བ་ལྔ་པ་"
+    ],
+    "june": [
+        "ཟླ་༦",
+        "ཟླ་བ་དྲུག་པ",
+        "ཟླ་བ་དྲུག་པ་"
+    ],
+    "july": [
+        "ཟླ་༧",
+        "ཟླ་བ་བདུན་པ",
+        "ཟླ་བ་བདུན་པ་"
+    ],
+    "august": [
+        "ཟླ་༨",
+        "ཟླ་བ་བརྒྱད་པ",
+        "ཟླ་བ་བརྒྱད་པ་"
+    ],
+    "september": [
+        "ཟླ་༩",
+        "ཟླ་བ་དགུ་པ",
+        "ཟླ་བ་དགུ་པ་"
+    ],
+    "october": [
+        "ཟླ་༡༠",
+        "ཟླ་བ་བཅུ་པ",
+        "ཟླ་བ་བཅུ་པ་"
+    ],
+    "november": [
+        "ཟླ་༡༡",
+        "ཟླ་བ་བཅུ་གཅིག་པ",
+        "ཟླ་བ་བཅུ་གཅིག་པ་"
+    ],
+    "december": [
+        "ཟླ་༡༢",
+        "ཟླ་བ་བཅུ་གཉིས་པ",
+        "ཟླ་བ་བཅུ་གཉིས་པ་"
+    ],
+    "monday": [
+        "གཟའ་ཟླ་བ་",
+        "ཟླ་བ་"
+    ],
+    "tuesday": [
+        "གཟའ་མིག་དམར་",
+        "མིག་དམར་"
+    ],
+    "wednesday": [
+        "གཟའ་ལྷག་པ་",
+        "ལྷག་པ་"
+    ],
+    "thursday": [
+        "གཟའ་ཕུར་བུ་",
+        "ཕུར་བུ་"
+    ],
+    "friday": [
+        "གཟའ་པ་སངས་",
+        "པ་སངས་"
+    ],
+    "saturday": [
+        "གཟའ་སྤེན་པ་",
+        "སྤེན་པ་"
+    ],
+    "sunday": [
+        "གཟའ་ཉི་མ་",
+        "ཉི་མ་"
+    ],
+    "am": [
+        "སྔ་དྲོ་"
+    ],
+    "pm": [
+        "ཕྱི་དྲོ་"
+    ],
+    "year": [
+        "ལོ།"
+    ],
+    "month": [
+        "ཟླ་བ་"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "ཉིན།"
+    ],
+    "hour": [
+        "hr",
+        "ཆུ་ཚོད་"
+    ],
+    "minute": [
+        "སྐར་མ།"
+    ],
+    "second": [
+        "སྐར་ཆ།"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "དེ་རིང་"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "ཁས་ས་"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "སང་ཉིན་"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {
+        "bo-IN": {
+            "name": "bo-IN"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,243 @@
+info = {
+    "name": "brx",
+    "date_order": "DMY",
+    "january": [
+        "जान",
+        "जानुवारी"
+    ],
+    "february": [
+        "फेब",
+        "फेब्रूवारी",
+        "फेब्रुवारी"
+    ],
+    "march": [
+        "मार्च",
+        "मार्स"
+    ],
+    "april": [
+        "एप्रि",
+        "एप्रिल",
+        "एफ्रिल"
+    ],
+    "may": [
+        "मे"
+    ],
+    "june": [
+        "जुन"
+    ],
+    "july": [
+        "जुल",
+        "जुलाई",
+        "जुलाइ"
+    ],
+    "august": [
+        "आग",
+        "आगष्ट",
+        "आगस्थ"
+    ],
+    "september": [
+        "सेप",
+        "सेप्थेम्बर",
+        "सेबथेज्ब़र"
+    ],
+    "october": [
+        "अक्ट'",
+        "अक्ट'बर",
+        "अखथबर"
+    ],
+    "november": [
+        "नवे",
+        "नवेम्बर",
+        "नबेज्ब़र"
+    ],
+    "december": [
+        "डिसे",
+        "डिसेम्बर",
+        "दिसेज्ब़र"
+    ],
+    "monday": [
+        "सम",
+        "समबार"
+    ],
+    "tuesday": [
+        "मंगल",
+        "मंगलबार"
+    ],
+    "wednesday": [
+        "बुध",
+        "बुधबार",
+        "बुद",
+        "बुदबार"
+    ],
+    "thursday": [
+        "बिस्थि",
+        "बिस्थिबार",
+        "बिसथि",
+        "बिसथिबार"
+    ],
+    "friday": [
+        "सुखुर",
+        "सुखुरबार",
+        "सुुखुरबार"
+    ],
+    "saturday": [
+        "सनि",
+        "सनिबार",
+        "सुनि",
+        "सुनिबार"
+    ],
+    "sunday": [
+        "रबि",
+        "रबिबार"
+    ],
+    "am": [
+        "फुं"
+    ],
+    "pm": [
+        "बेलासे"
+    ],
+    "year": [
+        "बोसोर"
+    ],
+    "month": [
+        "दान"
+    ],
+    "week": [
+        "सप्थाह",
+        "सबथा/हबथा"
+    ],
+    "day": [
+        "सान"
+    ],
+    "hour": [
+        "hr",
+        "घन्टा",
+        "रिंगा"
+    ],
+    "minute": [
+        "मिनित",
+        "मिनिथ"
+    ],
+    "second": [
+        "सेकेण्ड",
+        "सेखेन्द"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "दिनै"
+        ],
+        "0 hour ago": [
+            "बे घन्टा",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "बे मिनिट",
+            "this minute"
+        ],
+        "0 month ago": [
+            "बे दान",
+            "this month"
+        ],
+        "0 second ago": [
+            "दा",
+            "now"
+        ],
+        "0 week ago": [
+            "बे सप्थाह",
+            "this week"
+        ],
+        "0 year ago": [
+            "बे बोसोर",
+            "this year"
+        ],
+        "1 day ago": [
+            "मैया"
+        ],
+        "1 month ago": [
+            "थांनाय दान",
+            "last month"
+        ],
+        "1 week ago": [
+            "थांनाय सप्थाह",
+            "last week"
+        ],
+        "1 year ago": [
+            "थांनाय बोसोर",
+            "last year"
+        ],
+        "in 1 day": [
+            "गाबोन"
+        ],
+        "in 1 month": [
+            "फैगौ दान",
+            "next month"
+        ],
+        "in 1 week": [
+            "फैगौ सप्थाह",
+            "next week"
+        ],
+        "in 1 year": [
+            "फैगौ बोसोर",
+            "next year"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) सान सिगां"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) घन्टा सिगां"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) मिनिट सिगां"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) दान सिगां"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) सेकेण्ड सिगां"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) सप्थाह सिगां"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) बोसोर सिगां"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) सानाव"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) घन्टायाव"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) मिनिटआव"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) दानाव"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) सेकेण्डआव"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) सप्थाहयाव"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) बोसोरआव"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
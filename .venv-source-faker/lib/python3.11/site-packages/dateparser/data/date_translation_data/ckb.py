@@ -0,0 +1,155 @@
+info = {
+    "name": "ckb",
+    "date_order": "YMD",
+    "january": [
+        "کانوونی دووەم"
+    ],
+    "february": [
+        "شوبات"
+    ],
+    "march": [
+        "ئازار"
+    ],
+    "april": [
+        "نیسان"
+    ],
+    "may": [
+        "ئایار"
+    ],
+    "june": [
+        "حوزەیران"
+    ],
+    "july": [
+        "تەمووز"
+    ],
+    "august": [
+        "ئاب"
+    ],
+    "september": [
+        "ئەیلوول"
+    ],
+    "october": [
+        "تشرینی یەکەم"
+    ],
+    "november": [
+        "تشرینی دووەم"
+    ],
+    "december": [
+        "کانونی یەکەم"
+    ],
+    "monday": [
+        "دووشەممە"
+    ],
+    "tuesday": [
+        "سێشەممە"
+    ],
+    "wednesday": [
+        "چوارشەممە"
+    ],
+    "thursday": [
+        "پێنجشەممە"
+    ],
+    "friday": [
+        "ھەینی"
+    ],
+    "saturday": [
+        "شەممە"
+    ],
+    "sunday": [
+        "یەکشەممە"
+    ],
+    "am": [
+        "بن"
+    ],
+    "pm": [
+        "دن"
+    ],
+    "year": [
+        "year"
+    ],
+    "month": [
+        "month"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "day"
+    ],
+    "hour": [
+        "hour",
+        "hr"
+    ],
+    "minute": [
+        "minute"
+    ],
+    "second": [
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "today"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "yesterday"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {
+        "ckb-IR": {
+            "name": "ckb-IR"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,299 @@
+info = {
+    "name": "dsb",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januar",
+        "januara"
+    ],
+    "february": [
+        "feb",
+        "februar",
+        "februara"
+    ],
+    "march": [
+        "měr",
+        "měrc",
+        "měrca"
+    ],
+    "april": [
+        "apr",
+        "apryl",
+        "apryla"
+    ],
+    "may": [
+        "maj",
+        "maja"
+    ],
+    "june": [
+        "jun",
+        "junij",
+        "junija"
+    ],
+    "july": [
+        "jul",
+        "julij",
+        "julija"
+    ],
+    "august": [
+        "awg",
+        "awgust",
+        "awgusta"
+    ],
+    "september": [
+        "sep",
+        "september",
+        "septembra"
+    ],
+    "october": [
+        "okt",
+        "oktober",
+        "oktobra"
+    ],
+    "november": [
+        "now",
+        "nowember",
+        "nowembra"
+    ],
+    "december": [
+        "dec",
+        "december",
+        "decembra"
+    ],
+    "monday": [
+        "pón",
+        "pónjeźele"
+    ],
+    "tuesday": [
+        "wał",
+        "wałtora"
+    ],
+    "wednesday": [
+        "srj",
+        "srjoda"
+    ],
+    "thursday": [
+        "stw",
+        "stwórtk"
+    ],
+    "friday": [
+        "pět",
+        "pětk"
+    ],
+    "saturday": [
+        "sob",
+        "sobota"
+    ],
+    "sunday": [
+        "nje",
+        "njeźela"
+    ],
+    "am": [
+        "dop",
+        "dopołdnja"
+    ],
+    "pm": [
+        "wótp",
+        "wótpołdnja"
+    ],
+    "year": [
+        "l",
+        "lěto"
+    ],
+    "month": [
+        "mjas",
+        "mjasec"
+    ],
+    "week": [
+        "tyź",
+        "tyźeń"
+    ],
+    "day": [
+        "ź",
+        "źeń"
+    ],
+    "hour": [
+        "g",
+        "góź",
+        "góźina",
+        "góźiny"
+    ],
+    "minute": [
+        "m",
+        "min",
+        "minuta"
+    ],
+    "second": [
+        "s",
+        "sek",
+        "sekunda"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "źins",
+            "źinsa",
+            "źis"
+        ],
+        "0 hour ago": [
+            "w toś tej góźinje",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "w toś tej minuśe",
+            "this minute"
+        ],
+        "0 month ago": [
+            "te mjasec",
+            "ten mjasec",
+            "tot mjasec"
+        ],
+        "0 second ago": [
+            "něnto"
+        ],
+        "0 week ago": [
+            "te tyźeń",
+            "ten tyźeń",
+            "tot tyźeń"
+        ],
+        "0 year ago": [
+            "lět",
+            "lětosa",
+            "lěts"
+        ],
+        "1 day ago": [
+            "cora",
+            "cr",
+            "cra"
+        ],
+        "1 month ago": [
+            "zajź mjasec",
+            "zajźony mjasec",
+            "slědny mjasec"
+        ],
+        "1 week ago": [
+            "zajź tyźeń",
+            "zajźony tyźeń",
+            "slědny tyźeń"
+        ],
+        "1 year ago": [
+            "ło",
+            "łon",
+            "łoni"
+        ],
+        "in 1 day": [
+            "wit",
+            "witś",
+            "witśe"
+        ],
+        "in 1 month": [
+            "pśid mjasec",
+            "pśiduc mjasec",
+            "pśiducy mjasec"
+        ],
+        "in 1 week": [
+            "pśid tyźeń",
+            "pśiduc tyźeń",
+            "pśiducy tyźeń"
+        ],
+        "in 1 year": [
+            "zno",
+            "znow",
+            "znowa"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "pśed (\\d++[.,]?\\d*+) d",
+            "pśed (\\d++[.,]?\\d*+) dnj",
+            "pśed (\\d++[.,]?\\d*+) dnjami",
+            "pśed (\\d++[.,]?\\d*+) dnjom"
+        ],
+        "\\1 hour ago": [
+            "pśed (\\d++[.,]?\\d*+) g",
+            "pśed (\\d++[.,]?\\d*+) góź",
+            "pśed (\\d++[.,]?\\d*+) góźinami",
+            "pśed (\\d++[.,]?\\d*+) góźinu"
+        ],
+        "\\1 minute ago": [
+            "pśed (\\d++[.,]?\\d*+) m",
+            "pśed (\\d++[.,]?\\d*+) min",
+            "pśed (\\d++[.,]?\\d*+) minutami",
+            "pśed (\\d++[.,]?\\d*+) minutu"
+        ],
+        "\\1 month ago": [
+            "pśed (\\d++[.,]?\\d*+) mjas",
+            "pśed (\\d++[.,]?\\d*+) mjasecami",
+            "pśed (\\d++[.,]?\\d*+) mjasecom"
+        ],
+        "\\1 second ago": [
+            "pśed (\\d++[.,]?\\d*+) s",
+            "pśed (\\d++[.,]?\\d*+) sek",
+            "pśed (\\d++[.,]?\\d*+) sekundami",
+            "pśed (\\d++[.,]?\\d*+) sekundu"
+        ],
+        "\\1 week ago": [
+            "pśed (\\d++[.,]?\\d*+) tyź",
+            "pśed (\\d++[.,]?\\d*+) tyźenjami",
+            "pśed (\\d++[.,]?\\d*+) tyźenjom"
+        ],
+        "\\1 year ago": [
+            "pśed (\\d++[.,]?\\d*+) l",
+            "pśed (\\d++[.,]?\\d*+) lětami",
+            "pśed (\\d++[.,]?\\d*+) lětom"
+        ],
+        "in \\1 day": [
+            "za (\\d++[.,]?\\d*+) dnj",
+            "za (\\d++[.,]?\\d*+) dnjow",
+            "za (\\d++[.,]?\\d*+) ź",
+            "za (\\d++[.,]?\\d*+) źeń"
+        ],
+        "in \\1 hour": [
+            "za (\\d++[.,]?\\d*+) g",
+            "za (\\d++[.,]?\\d*+) góź",
+            "za (\\d++[.,]?\\d*+) góźin",
+            "za (\\d++[.,]?\\d*+) góźinu"
+        ],
+        "in \\1 minute": [
+            "za (\\d++[.,]?\\d*+) m",
+            "za (\\d++[.,]?\\d*+) min",
+            "za (\\d++[.,]?\\d*+) minutow",
+            "za (\\d++[.,]?\\d*+) minutu"
+        ],
+        "in \\1 month": [
+            "za (\\d++[.,]?\\d*+) mjas",
+            "za (\\d++[.,]?\\d*+) mjasec",
+            "za (\\d++[.,]?\\d*+) mjasecow"
+        ],
+        "in \\1 second": [
+            "za (\\d++[.,]?\\d*+) s",
+            "za (\\d++[.,]?\\d*+) sek",
+            "za (\\d++[.,]?\\d*+) sekundow",
+            "za (\\d++[.,]?\\d*+) sekundu"
+        ],
+        "in \\1 week": [
+            "za (\\d++[.,]?\\d*+) tyź",
+            "za (\\d++[.,]?\\d*+) tyźenjow",
+            "za (\\d++[.,]?\\d*+) tyźeń"
+        ],
+        "in \\1 year": [
+            "za (\\d++[.,]?\\d*+) l",
+            "za (\\d++[.,]?\\d*+) lět",
+            "za (\\d++[.,]?\\d*+) lěto"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
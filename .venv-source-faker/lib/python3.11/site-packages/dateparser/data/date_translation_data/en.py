@@ -0,0 +1,1208 @@
+info = {
+    "name": "en",
+    "date_order": "MDY",
+    "january": [
+        "jan",
+        "january"
+    ],
+    "february": [
+        "feb",
+        "february"
+    ],
+    "march": [
+        "mar",
+        "march"
+    ],
+    "april": [
+        "apr",
+        "april"
+    ],
+    "may": [
+        "may"
+    ],
+    "june": [
+        "jun",
+        "june"
+    ],
+    "july": [
+        "jul",
+        "july"
+    ],
+    "august": [
+        "aug",
+        "august"
+    ],
+    "september": [
+        "sep",
+        "september",
+        "sept"
+    ],
+    "october": [
+        "oct",
+        "october"
+    ],
+    "november": [
+        "nov",
+        "november"
+    ],
+    "december": [
+        "dec",
+        "december"
+    ],
+    "monday": [
+        "mon",
+        "monday",
+        "mo"
+    ],
+    "tuesday": [
+        "tue",
+        "tuesday",
+        "tu",
+        "Tues"
+    ],
+    "wednesday": [
+        "wed",
+        "wednesday",
+        "we"
+    ],
+    "thursday": [
+        "thu",
+        "thursday",
+        "th"
+    ],
+    "friday": [
+        "fri",
+        "friday",
+        "fr"
+    ],
+    "saturday": [
+        "sat",
+        "saturday",
+        "sa"
+    ],
+    "sunday": [
+        "sun",
+        "sunday",
+        "su"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "year",
+        "yr",
+        "y",
+        "years"
+    ],
+    "month": [
+        "mo",
+        "month",
+        "months"
+    ],
+    "week": [
+        "week",
+        "wk",
+        "weeks"
+    ],
+    "day": [
+        "day",
+        "d",
+        "days"
+    ],
+    "hour": [
+        "hour",
+        "hours",
+        "hr",
+        "h",
+        "hours",
+        "hrs"
+    ],
+    "minute": [
+        "min",
+        "minute",
+        "m",
+        "minutes",
+        "mins"
+    ],
+    "second": [
+        "sec",
+        "second",
+        "s",
+        "seconds",
+        "secs"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "today",
+            "till date"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this mo",
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week",
+            "this wk"
+        ],
+        "0 year ago": [
+            "this year",
+            "this yr"
+        ],
+        "1 day ago": [
+            "yesterday"
+        ],
+        "1 month ago": [
+            "last mo",
+            "last month"
+        ],
+        "1 week ago": [
+            "last week",
+            "last wk"
+        ],
+        "1 year ago": [
+            "last year",
+            "last yr"
+        ],
+        "in 1 day": [
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "next mo",
+            "next month"
+        ],
+        "in 1 week": [
+            "next week",
+            "next wk"
+        ],
+        "in 1 year": [
+            "next year",
+            "next yr"
+        ],
+        "2 day ago": [
+            "day before yesterday"
+        ],
+        "1 decade ago": [
+            "last decade",
+            "this decade"
+        ],
+        "in 1 decade": [
+            "next decade"
+        ],
+        "in 2 day": [
+            "day after tomorrow"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) day ago",
+            "(\\d++[.,]?\\d*+) days ago",
+            "(\\d++[.,]?\\d*+)d ago"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) hour ago",
+            "(\\d++[.,]?\\d*+) hours ago",
+            "(\\d++[.,]?\\d*+) hr ago",
+            "(\\d++[.,]?\\d*+)h ago"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) min ago",
+            "(\\d++[.,]?\\d*+) minute ago",
+            "(\\d++[.,]?\\d*+) minutes ago",
+            "(\\d++[.,]?\\d*+)m ago"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) mo ago",
+            "(\\d++[.,]?\\d*+) month ago",
+            "(\\d++[.,]?\\d*+) months ago",
+            "(\\d++[.,]?\\d*+)mo ago"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) sec ago",
+            "(\\d++[.,]?\\d*+) second ago",
+            "(\\d++[.,]?\\d*+) seconds ago",
+            "(\\d++[.,]?\\d*+)s ago"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) week ago",
+            "(\\d++[.,]?\\d*+) weeks ago",
+            "(\\d++[.,]?\\d*+) wk ago",
+            "(\\d++[.,]?\\d*+)w ago"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) year ago",
+            "(\\d++[.,]?\\d*+) years ago",
+            "(\\d++[.,]?\\d*+) yr ago",
+            "(\\d++[.,]?\\d*+)y ago"
+        ],
+        "in \\1 day": [
+            "in (\\d++[.,]?\\d*+) day",
+            "in (\\d++[.,]?\\d*+) days",
+            "in (\\d++[.,]?\\d*+)d"
+        ],
+        "in \\1 hour": [
+            "in (\\d++[.,]?\\d*+) hour",
+            "in (\\d++[.,]?\\d*+) hours",
+            "in (\\d++[.,]?\\d*+) hr",
+            "in (\\d++[.,]?\\d*+)h"
+        ],
+        "in \\1 minute": [
+            "in (\\d++[.,]?\\d*+) min",
+            "in (\\d++[.,]?\\d*+) minute",
+            "in (\\d++[.,]?\\d*+) minutes",
+            "in (\\d++[.,]?\\d*+)m"
+        ],
+        "in \\1 month": [
+            "in (\\d++[.,]?\\d*+) mo",
+            "in (\\d++[.,]?\\d*+) month",
+            "in (\\d++[.,]?\\d*+) months",
+            "in (\\d++[.,]?\\d*+)mo"
+        ],
+        "in \\1 second": [
+            "in (\\d++[.,]?\\d*+) sec",
+            "in (\\d++[.,]?\\d*+) second",
+            "in (\\d++[.,]?\\d*+) seconds",
+            "in (\\d++[.,]?\\d*+)s"
+        ],
+        "in \\1 week": [
+            "in (\\d++[.,]?\\d*+) week",
+            "in (\\d++[.,]?\\d*+) weeks",
+            "in (\\d++[.,]?\\d*+) wk",
+            "in (\\d++[.,]?\\d*+)w",
+            "in (\\d++[.,]?\\d*+) weeks time",
+            "in (\\d++[.,]?\\d*+) weeks' time"
+        ],
+        "in \\1 year": [
+            "in (\\d++[.,]?\\d*+) year",
+            "in (\\d++[.,]?\\d*+) years",
+            "in (\\d++[.,]?\\d*+) yr",
+            "in (\\d++[.,]?\\d*+)y"
+        ],
+        "in \\1 decade": [
+            "in (\\d++[.,]?\\d*+) decades?"
+        ],
+        "\\1 decade ago": [
+            "(\\d++[.,]?\\d*+) decades? ago"
+        ]
+    },
+    "locale_specific": {
+        "en-001": {
+            "name": "en-001",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-150": {
+            "name": "en-150",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-AE": {
+            "name": "en-AE",
+            "date_order": "DMY"
+        },
+        "en-AG": {
+            "name": "en-AG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-AI": {
+            "name": "en-AI",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-AS": {
+            "name": "en-AS"
+        },
+        "en-AT": {
+            "name": "en-AT",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-AU": {
+            "name": "en-AU",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ],
+            "relative-type-regex": {
+                "\\1 hour ago": [
+                    "(\\d++[.,]?\\d*+) hrs ago"
+                ],
+                "\\1 minute ago": [
+                    "(\\d++[.,]?\\d*+) mins ago"
+                ],
+                "\\1 second ago": [
+                    "(\\d++[.,]?\\d*+) secs ago"
+                ],
+                "\\1 week ago": [
+                    "(\\d++[.,]?\\d*+) wks ago"
+                ],
+                "\\1 year ago": [
+                    "(\\d++[.,]?\\d*+) yrs ago"
+                ],
+                "in \\1 hour": [
+                    "in (\\d++[.,]?\\d*+) hrs"
+                ],
+                "in \\1 minute": [
+                    "in (\\d++[.,]?\\d*+) mins"
+                ],
+                "in \\1 second": [
+                    "in (\\d++[.,]?\\d*+) secs"
+                ],
+                "in \\1 week": [
+                    "in (\\d++[.,]?\\d*+) wks"
+                ],
+                "in \\1 year": [
+                    "in (\\d++[.,]?\\d*+) yrs"
+                ]
+            }
+        },
+        "en-BB": {
+            "name": "en-BB",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-BE": {
+            "name": "en-BE",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-BI": {
+            "name": "en-BI"
+        },
+        "en-BM": {
+            "name": "en-BM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-BS": {
+            "name": "en-BS",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-BW": {
+            "name": "en-BW",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-BZ": {
+            "name": "en-BZ",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CA": {
+            "name": "en-CA",
+            "date_order": "YMD",
+            "relative-type-regex": {
+                "\\1 hour ago": [
+                    "(\\d++[.,]?\\d*+) hrs ago"
+                ],
+                "\\1 minute ago": [
+                    "(\\d++[.,]?\\d*+) mins ago"
+                ],
+                "\\1 month ago": [
+                    "(\\d++[.,]?\\d*+) mos ago"
+                ],
+                "\\1 second ago": [
+                    "(\\d++[.,]?\\d*+) secs ago"
+                ],
+                "\\1 week ago": [
+                    "(\\d++[.,]?\\d*+) wks ago"
+                ],
+                "\\1 year ago": [
+                    "(\\d++[.,]?\\d*+) yrs ago"
+                ],
+                "in \\1 hour": [
+                    "in (\\d++[.,]?\\d*+) hrs"
+                ],
+                "in \\1 minute": [
+                    "in (\\d++[.,]?\\d*+) mins"
+                ],
+                "in \\1 month": [
+                    "in (\\d++[.,]?\\d*+) mos"
+                ],
+                "in \\1 second": [
+                    "in (\\d++[.,]?\\d*+) secs"
+                ],
+                "in \\1 week": [
+                    "in (\\d++[.,]?\\d*+) wks"
+                ],
+                "in \\1 year": [
+                    "in (\\d++[.,]?\\d*+) yrs"
+                ]
+            }
+        },
+        "en-CC": {
+            "name": "en-CC",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CH": {
+            "name": "en-CH",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CK": {
+            "name": "en-CK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CM": {
+            "name": "en-CM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CX": {
+            "name": "en-CX",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-CY": {
+            "name": "en-CY",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-DE": {
+            "name": "en-DE",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-DG": {
+            "name": "en-DG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-DK": {
+            "name": "en-DK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-DM": {
+            "name": "en-DM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-ER": {
+            "name": "en-ER",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-FI": {
+            "name": "en-FI",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-FJ": {
+            "name": "en-FJ",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-FK": {
+            "name": "en-FK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-FM": {
+            "name": "en-FM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GB": {
+            "name": "en-GB",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GD": {
+            "name": "en-GD",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GG": {
+            "name": "en-GG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GH": {
+            "name": "en-GH",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GI": {
+            "name": "en-GI",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GM": {
+            "name": "en-GM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-GU": {
+            "name": "en-GU"
+        },
+        "en-GY": {
+            "name": "en-GY",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-HK": {
+            "name": "en-HK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-ID": {
+            "name": "en-ID",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-IE": {
+            "name": "en-IE",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-IL": {
+            "name": "en-IL",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-IM": {
+            "name": "en-IM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-IN": {
+            "name": "en-IN",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-IO": {
+            "name": "en-IO",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-JE": {
+            "name": "en-JE",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-JM": {
+            "name": "en-JM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-KE": {
+            "name": "en-KE",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-KI": {
+            "name": "en-KI",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-KN": {
+            "name": "en-KN",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-KY": {
+            "name": "en-KY",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-LC": {
+            "name": "en-LC",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-LR": {
+            "name": "en-LR",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-LS": {
+            "name": "en-LS",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MG": {
+            "name": "en-MG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MH": {
+            "name": "en-MH"
+        },
+        "en-MO": {
+            "name": "en-MO",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MP": {
+            "name": "en-MP"
+        },
+        "en-MS": {
+            "name": "en-MS",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MT": {
+            "name": "en-MT",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MU": {
+            "name": "en-MU",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MV": {
+            "name": "en-MV",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MW": {
+            "name": "en-MW",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-MY": {
+            "name": "en-MY",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NA": {
+            "name": "en-NA",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NF": {
+            "name": "en-NF",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NG": {
+            "name": "en-NG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NL": {
+            "name": "en-NL",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NR": {
+            "name": "en-NR",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NU": {
+            "name": "en-NU",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-NZ": {
+            "name": "en-NZ",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-PG": {
+            "name": "en-PG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-PH": {
+            "name": "en-PH"
+        },
+        "en-PK": {
+            "name": "en-PK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-PN": {
+            "name": "en-PN",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-PR": {
+            "name": "en-PR"
+        },
+        "en-PW": {
+            "name": "en-PW",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-RW": {
+            "name": "en-RW",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SB": {
+            "name": "en-SB",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SC": {
+            "name": "en-SC",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SD": {
+            "name": "en-SD",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SE": {
+            "name": "en-SE",
+            "date_order": "YMD",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SG": {
+            "name": "en-SG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ],
+            "month": [
+                "mth"
+            ],
+            "relative-type": {
+                "0 month ago": [
+                    "this mth"
+                ],
+                "1 month ago": [
+                    "last mth"
+                ],
+                "in 1 month": [
+                    "next mth"
+                ]
+            },
+            "relative-type-regex": {
+                "\\1 month ago": [
+                    "(\\d++[.,]?\\d*+) mth ago"
+                ],
+                "in \\1 month": [
+                    "in (\\d++[.,]?\\d*+) mth"
+                ]
+            }
+        },
+        "en-SH": {
+            "name": "en-SH",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SI": {
+            "name": "en-SI",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SL": {
+            "name": "en-SL",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SS": {
+            "name": "en-SS",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SX": {
+            "name": "en-SX",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-SZ": {
+            "name": "en-SZ",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TC": {
+            "name": "en-TC",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TK": {
+            "name": "en-TK",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TO": {
+            "name": "en-TO",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TT": {
+            "name": "en-TT",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TV": {
+            "name": "en-TV",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-TZ": {
+            "name": "en-TZ",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-UG": {
+            "name": "en-UG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-UM": {
+            "name": "en-UM"
+        },
+        "en-VC": {
+            "name": "en-VC",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-VG": {
+            "name": "en-VG",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-VI": {
+            "name": "en-VI"
+        },
+        "en-VU": {
+            "name": "en-VU",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-WS": {
+            "name": "en-WS",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-ZA": {
+            "name": "en-ZA",
+            "date_order": "YMD",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-ZM": {
+            "name": "en-ZM",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-ZW": {
+            "name": "en-ZW",
+            "date_order": "DMY",
+            "september": [
+                "sept"
+            ]
+        },
+        "en-US": {
+            "name": "en-US",
+            "date_order": "MDY"
+        }
+    },
+    "skip": [
+        "about",
+        "ad",
+        "and",
+        "at",
+        "by",
+        "from",
+        "just",
+        "m",
+        "nd",
+        "of",
+        "on",
+        "rd",
+        "st",
+        "th",
+        "the",
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ],
+    "pertain": [
+        "of"
+    ],
+    "sentence_splitter_group": 1,
+    "decade": [
+        "decade",
+        "decades"
+    ],
+    "ago": [
+        "ago",
+        "before"
+    ],
+    "in": [
+        "in",
+        "from now",
+        "after"
+    ],
+    "simplifications": [
+        {
+            "(\\d++[.,]?\\d*+)\\s*mons?\\b": "\\1 month"
+        },
+        {
+            "an": "1"
+        },
+        {
+            "a": "1"
+        },
+        {
+            "(?:12\\s+)?noon": "12:00"
+        },
+        {
+            "(?:12\\s+)?midnight": "00:00"
+        },
+        {
+            "(\\d++[.,]?\\d*+)h(\\d++[.,]?\\d*+)": "\\1:\\2"
+        },
+        {
+            "from\\s+now": "in"
+        },
+        {
+            "less than 1 minute ago": "45 second ago"
+        },
+        {
+            "(\\d++[.,]?\\d*+|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve) (decade|year|month|week|day|hour|minute|second)s? later": "in \\1 \\2"
+        },
+        {
+            "one": "1"
+        },
+        {
+            "two": "2"
+        },
+        {
+            "three": "3"
+        },
+        {
+            "four": "4"
+        },
+        {
+            "five": "5"
+        },
+        {
+            "six": "6"
+        },
+        {
+            "seven": "7"
+        },
+        {
+            "eight": "8"
+        },
+        {
+            "nine": "9"
+        },
+        {
+            "ten": "10"
+        },
+        {
+            "eleven": "11"
+        },
+        {
+            "twelve": "12"
+        }
+    ]
+}
@@ -0,0 +1,264 @@
+info = {
+    "name": "gl",
+    "date_order": "DMY",
+    "january": [
+        "xan",
+        "xaneiro"
+    ],
+    "february": [
+        "feb",
+        "febreiro"
+    ],
+    "march": [
+        "mar",
+        "marzo"
+    ],
+    "april": [
+        "abr",
+        "abril"
+    ],
+    "may": [
+        "maio"
+    ],
+    "june": [
+        "xuño"
+    ],
+    "july": [
+        "xul",
+        "xullo"
+    ],
+    "august": [
+        "ago",
+        "agosto"
+    ],
+    "september": [
+        "set",
+        "setembro"
+    ],
+    "october": [
+        "out",
+        "outubro"
+    ],
+    "november": [
+        "nov",
+        "novembro"
+    ],
+    "december": [
+        "dec",
+        "decembro"
+    ],
+    "monday": [
+        "luns"
+    ],
+    "tuesday": [
+        "mar",
+        "martes"
+    ],
+    "wednesday": [
+        "mér",
+        "mércores"
+    ],
+    "thursday": [
+        "xov",
+        "xoves"
+    ],
+    "friday": [
+        "ven",
+        "venres"
+    ],
+    "saturday": [
+        "sáb",
+        "sábado"
+    ],
+    "sunday": [
+        "dom",
+        "domingo"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "ano",
+        "a"
+    ],
+    "month": [
+        "mes",
+        "m"
+    ],
+    "week": [
+        "sem",
+        "semana"
+    ],
+    "day": [
+        "día",
+        "d"
+    ],
+    "hour": [
+        "h",
+        "hora",
+        "horas"
+    ],
+    "minute": [
+        "min",
+        "minuto"
+    ],
+    "second": [
+        "s",
+        "segundo"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "hoxe"
+        ],
+        "0 hour ago": [
+            "esta hora",
+            "nesta hora"
+        ],
+        "0 minute ago": [
+            "este minuto",
+            "neste minuto"
+        ],
+        "0 month ago": [
+            "este mes",
+            "este m"
+        ],
+        "0 second ago": [
+            "agora"
+        ],
+        "0 week ago": [
+            "esta sem",
+            "esta semana"
+        ],
+        "0 year ago": [
+            "este ano"
+        ],
+        "1 day ago": [
+            "onte"
+        ],
+        "1 month ago": [
+            "o mes pas",
+            "o mes pasado",
+            "m pasado"
+        ],
+        "1 week ago": [
+            "a sem pas",
+            "a sem pasada",
+            "a semana pasada",
+            "sem pasada"
+        ],
+        "1 year ago": [
+            "o ano pas",
+            "o ano pasado",
+            "ano pasado"
+        ],
+        "in 1 day": [
+            "mañá"
+        ],
+        "in 1 month": [
+            "o próx mes",
+            "o próximo mes",
+            "m seguinte"
+        ],
+        "in 1 week": [
+            "a próx sem",
+            "a próxima sem",
+            "a próxima semana",
+            "sem seguinte"
+        ],
+        "in 1 year": [
+            "o próx ano",
+            "o próximo ano",
+            "seguinte ano"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "hai (\\d++[.,]?\\d*+) día",
+            "hai (\\d++[.,]?\\d*+) días",
+            "hai (\\d++[.,]?\\d*+) d"
+        ],
+        "\\1 hour ago": [
+            "hai (\\d++[.,]?\\d*+) h",
+            "hai (\\d++[.,]?\\d*+) hora",
+            "hai (\\d++[.,]?\\d*+) horas"
+        ],
+        "\\1 minute ago": [
+            "hai (\\d++[.,]?\\d*+) min",
+            "hai (\\d++[.,]?\\d*+) minuto",
+            "hai (\\d++[.,]?\\d*+) minutos"
+        ],
+        "\\1 month ago": [
+            "hai (\\d++[.,]?\\d*+) mes",
+            "hai (\\d++[.,]?\\d*+) meses",
+            "hai (\\d++[.,]?\\d*+) m"
+        ],
+        "\\1 second ago": [
+            "hai (\\d++[.,]?\\d*+) s",
+            "hai (\\d++[.,]?\\d*+) segundo",
+            "hai (\\d++[.,]?\\d*+) segundos"
+        ],
+        "\\1 week ago": [
+            "hai (\\d++[.,]?\\d*+) sem",
+            "hai (\\d++[.,]?\\d*+) semana",
+            "hai (\\d++[.,]?\\d*+) semanas"
+        ],
+        "\\1 year ago": [
+            "hai (\\d++[.,]?\\d*+) ano",
+            "hai (\\d++[.,]?\\d*+) anos",
+            "hai (\\d++[.,]?\\d*+) a"
+        ],
+        "in \\1 day": [
+            "en (\\d++[.,]?\\d*+) día",
+            "en (\\d++[.,]?\\d*+) días",
+            "en (\\d++[.,]?\\d*+) d"
+        ],
+        "in \\1 hour": [
+            "en (\\d++[.,]?\\d*+) h",
+            "en (\\d++[.,]?\\d*+) hora",
+            "en (\\d++[.,]?\\d*+) horas"
+        ],
+        "in \\1 minute": [
+            "en (\\d++[.,]?\\d*+) min",
+            "en (\\d++[.,]?\\d*+) minuto",
+            "en (\\d++[.,]?\\d*+) minutos"
+        ],
+        "in \\1 month": [
+            "en (\\d++[.,]?\\d*+) mes",
+            "en (\\d++[.,]?\\d*+) meses",
+            "en (\\d++[.,]?\\d*+) m"
+        ],
+        "in \\1 second": [
+            "en (\\d++[.,]?\\d*+) s",
+            "en (\\d++[.,]?\\d*+) segundo",
+            "en (\\d++[.,]?\\d*+) segundos"
+        ],
+        "in \\1 week": [
+            "en (\\d++[.,]?\\d*+) sem",
+            "en (\\d++[.,]?\\d*+) semana",
+            "en (\\d++[.,]?\\d*+) semanas"
+        ],
+        "in \\1 year": [
+            "en (\\d++[.,]?\\d*+) ano",
+            "en (\\d++[.,]?\\d*+) anos",
+            "en (\\d++[.,]?\\d*+) a"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,245 @@
+info = {
+    "name": "ha",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "janairu"
+    ],
+    "february": [
+        "fab",
+        "faburairu"
+    ],
+    "march": [
+        "mar",
+        "maris"
+    ],
+    "april": [
+        "afi",
+        "afirilu"
+    ],
+    "may": [
+        "may",
+        "mayu"
+    ],
+    "june": [
+        "yun",
+        "yuni"
+    ],
+    "july": [
+        "yul",
+        "yuli"
+    ],
+    "august": [
+        "agu",
+        "agusta"
+    ],
+    "september": [
+        "sat",
+        "satumba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nuw",
+        "nuwamba"
+    ],
+    "december": [
+        "dis",
+        "disamba"
+    ],
+    "monday": [
+        "lit",
+        "litinin"
+    ],
+    "tuesday": [
+        "tal",
+        "talata"
+    ],
+    "wednesday": [
+        "lar",
+        "laraba"
+    ],
+    "thursday": [
+        "alh",
+        "alhamis"
+    ],
+    "friday": [
+        "jum",
+        "jumma'a"
+    ],
+    "saturday": [
+        "asa",
+        "asabar"
+    ],
+    "sunday": [
+        "lah",
+        "lahadi"
+    ],
+    "am": [
+        "safiya",
+        "sf",
+        "am"
+    ],
+    "pm": [
+        "yamma",
+        "ym",
+        "pm"
+    ],
+    "year": [
+        "shekara"
+    ],
+    "month": [
+        "wata"
+    ],
+    "week": [
+        "mako"
+    ],
+    "day": [
+        "kwana"
+    ],
+    "hour": [
+        "awa",
+        "sa'o'i"
+    ],
+    "minute": [
+        "minti"
+    ],
+    "second": [
+        "daƙiƙa"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "yau"
+        ],
+        "0 hour ago": [
+            "wannan awa",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "wannan mintin",
+            "this minute"
+        ],
+        "0 month ago": [
+            "wannan watan",
+            "this month"
+        ],
+        "0 second ago": [
+            "yanzu",
+            "now"
+        ],
+        "0 week ago": [
+            "wannan satin",
+            "this week"
+        ],
+        "0 year ago": [
+            "bana",
+            "this year"
+        ],
+        "1 day ago": [
+            "jiya"
+        ],
+        "1 month ago": [
+            "watan da ya gabata",
+            "last month"
+        ],
+        "1 week ago": [
+            "satin da ya gabata",
+            "last week"
+        ],
+        "1 year ago": [
+            "bara",
+            "last year"
+        ],
+        "in 1 day": [
+            "gobe"
+        ],
+        "in 1 month": [
+            "wata na gaba",
+            "next month"
+        ],
+        "in 1 week": [
+            "sati na gaba",
+            "next week"
+        ],
+        "in 1 year": [
+            "badi",
+            "next year"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "kwanaki da suka gabata (\\d++[.,]?\\d*+)",
+            "rana da ya gabata (\\d++[.,]?\\d*+)"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) awa da ya gabata"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) minti da ya gabata"
+        ],
+        "\\1 month ago": [
+            "watan da ya gabata (\\d++[.,]?\\d*+)",
+            "watanni da suka gabata (\\d++[.,]?\\d*+)}"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) dakika da ya gabata"
+        ],
+        "\\1 week ago": [
+            "mako da suka gabata (\\d++[.,]?\\d*+)",
+            "mako da ya gabata (\\d++[.,]?\\d*+)",
+            "makonni da suka gabata (\\d++[.,]?\\d*+)"
+        ],
+        "\\1 year ago": [
+            "shekara da suka gabata (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 day": [
+            "a cikin kwanaki (\\d++[.,]?\\d*+)",
+            "a cikin rana (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 hour": [
+            "cikin (\\d++[.,]?\\d*+) awa"
+        ],
+        "in \\1 minute": [
+            "cikin (\\d++[.,]?\\d*+) minti"
+        ],
+        "in \\1 month": [
+            "a cikin watan (\\d++[.,]?\\d*+)",
+            "a cikin watanni (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 second": [
+            "cikin (\\d++[.,]?\\d*+) dakika"
+        ],
+        "in \\1 week": [
+            "a cikin mako (\\d++[.,]?\\d*+)",
+            "a cikin makonni (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 year": [
+            "a shekarar (\\d++[.,]?\\d*+)",
+            "a shekaru (\\d++[.,]?\\d*+)"
+        ]
+    },
+    "locale_specific": {
+        "ha-GH": {
+            "name": "ha-GH"
+        },
+        "ha-NE": {
+            "name": "ha-NE"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,189 @@
+info = {
+    "name": "ig",
+    "date_order": "DMY",
+    "january": [
+        "jen",
+        "jenụwarị"
+    ],
+    "february": [
+        "feb",
+        "febrụwarị"
+    ],
+    "march": [
+        "maa",
+        "maachị"
+    ],
+    "april": [
+        "epr",
+        "epreel",
+        "eprel"
+    ],
+    "may": [
+        "mee"
+    ],
+    "june": [
+        "juu",
+        "juun"
+    ],
+    "july": [
+        "jul",
+        "julaị"
+    ],
+    "august": [
+        "ọgọ",
+        "ọgọọst"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "ọkt",
+        "ọktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "dis",
+        "disemba"
+    ],
+    "monday": [
+        "mọn",
+        "mọnde"
+    ],
+    "tuesday": [
+        "tiu",
+        "tiuzdee"
+    ],
+    "wednesday": [
+        "wen",
+        "wenezdee"
+    ],
+    "thursday": [
+        "tọọ",
+        "tọọzdee"
+    ],
+    "friday": [
+        "fraị",
+        "fraịdee"
+    ],
+    "saturday": [
+        "sat",
+        "satọdee"
+    ],
+    "sunday": [
+        "sọn",
+        "sọndee",
+        "mbọsị ụka",
+        "ụka"
+    ],
+    "am": [
+        "am",
+        "n'ụtụtụ"
+    ],
+    "pm": [
+        "n'abali",
+        "pm"
+    ],
+    "year": [
+        "afọ"
+    ],
+    "month": [
+        "ọnwa"
+    ],
+    "week": [
+        "izu"
+    ],
+    "day": [
+        "ụbọchị"
+    ],
+    "hour": [
+        "elekere",
+        "hr"
+    ],
+    "minute": [
+        "nkeji"
+    ],
+    "second": [
+        "tịm kọm",
+        "nkejinta"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "taa",
+            "taata"
+        ],
+        "0 hour ago": [
+            "elekere a",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "nkejị a",
+            "this minute"
+        ],
+        "0 month ago": [
+            "ọnwa a",
+            "this month"
+        ],
+        "0 second ago": [
+            "ụgbụa",
+            "now"
+        ],
+        "0 week ago": [
+            "izu a",
+            "this week"
+        ],
+        "0 year ago": [
+            "afọ a",
+            "this year"
+        ],
+        "1 day ago": [
+            "ụnyaahụ",
+            "nnyaafụ"
+        ],
+        "1 month ago": [
+            "ọnwa gara aga",
+            "last month"
+        ],
+        "1 week ago": [
+            "izu gara aga",
+            "last week"
+        ],
+        "1 year ago": [
+            "afọ gara aga",
+            "last year"
+        ],
+        "in 1 day": [
+            "echi"
+        ],
+        "in 1 month": [
+            "ọnwa ọzọ",
+            "next month"
+        ],
+        "in 1 week": [
+            "izu na-esote",
+            "next week"
+        ],
+        "in 1 year": [
+            "afọ ọzọ",
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
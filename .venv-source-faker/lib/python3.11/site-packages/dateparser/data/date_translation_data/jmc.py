@@ -0,0 +1,169 @@
+info = {
+    "name": "jmc",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januari"
+    ],
+    "february": [
+        "feb",
+        "februari"
+    ],
+    "march": [
+        "mac",
+        "machi"
+    ],
+    "april": [
+        "apr",
+        "aprilyi"
+    ],
+    "may": [
+        "mei"
+    ],
+    "june": [
+        "jun",
+        "junyi"
+    ],
+    "july": [
+        "jul",
+        "julyai"
+    ],
+    "august": [
+        "ago",
+        "agusti"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "des",
+        "desemba"
+    ],
+    "monday": [
+        "jtt",
+        "jumatatuu"
+    ],
+    "tuesday": [
+        "jnn",
+        "jumanne"
+    ],
+    "wednesday": [
+        "jtn",
+        "jumatanu"
+    ],
+    "thursday": [
+        "alh",
+        "alhamisi"
+    ],
+    "friday": [
+        "iju",
+        "ijumaa"
+    ],
+    "saturday": [
+        "jmo",
+        "jumamosi"
+    ],
+    "sunday": [
+        "jpi",
+        "jumapilyi"
+    ],
+    "am": [
+        "utuko"
+    ],
+    "pm": [
+        "kyiukonyi"
+    ],
+    "year": [
+        "maka"
+    ],
+    "month": [
+        "mori"
+    ],
+    "week": [
+        "wiikyi"
+    ],
+    "day": [
+        "mfiri"
+    ],
+    "hour": [
+        "hr",
+        "saa"
+    ],
+    "minute": [
+        "dakyika"
+    ],
+    "second": [
+        "sekunde"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "inu"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "ukou"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "ngama"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,174 @@
+info = {
+    "name": "ks",
+    "date_order": "MDY",
+    "january": [
+        "جنؤری"
+    ],
+    "february": [
+        "فرؤری"
+    ],
+    "march": [
+        "مارٕچ"
+    ],
+    "april": [
+        "اپریل"
+    ],
+    "may": [
+        "مئی",
+        "میٔ"
+    ],
+    "june": [
+        "جوٗن"
+    ],
+    "july": [
+        "جوٗلایی",
+        "جُلَے"
+    ],
+    "august": [
+        "اگست"
+    ],
+    "september": [
+        "ستمبر"
+    ],
+    "october": [
+        "اکتوٗبر"
+    ],
+    "november": [
+        "نومبر"
+    ],
+    "december": [
+        "دسمبر",
+        "دَسَمبَر"
+    ],
+    "monday": [
+        "ژٔندرٕروار",
+        "ژٔندٕروار",
+        "ژٔنٛدرٕروار",
+        "ژٔنٛدٕروار"
+    ],
+    "tuesday": [
+        "بۆموار",
+        "بوٚموار"
+    ],
+    "wednesday": [
+        "بودوار"
+    ],
+    "thursday": [
+        "برؠسوار",
+        "برٛٮ۪سوار"
+    ],
+    "friday": [
+        "جُمہ"
+    ],
+    "saturday": [
+        "بٹوار"
+    ],
+    "sunday": [
+        "آتھوار",
+        "اَتھوار"
+    ],
+    "am": [
+        "am",
+        "اے ایم"
+    ],
+    "pm": [
+        "pm",
+        "پی ایم"
+    ],
+    "year": [
+        "ؤری"
+    ],
+    "month": [
+        "رؠتھ",
+        "رٮ۪تھ"
+    ],
+    "week": [
+        "ہفتہٕ"
+    ],
+    "day": [
+        "دۄہ"
+    ],
+    "hour": [
+        "hr",
+        "گٲنٹہٕ",
+        "گٲنٛٹہٕ"
+    ],
+    "minute": [
+        "مِنَٹ"
+    ],
+    "second": [
+        "سؠکَنڈ",
+        "سٮ۪کَنڑ"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "اَز"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "یٕہ ریتھۍ",
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "یٕہ ہفتہ",
+            "this week"
+        ],
+        "0 year ago": [
+            "یٕہ ؤری",
+            "this year"
+        ],
+        "1 day ago": [
+            "راتھ"
+        ],
+        "1 month ago": [
+            "پٔتِم ریتھۍ",
+            "last month"
+        ],
+        "1 week ago": [
+            "پٔتِم ہفتہ",
+            "last week"
+        ],
+        "1 year ago": [
+            "پٔتِم ؤری",
+            "last year"
+        ],
+        "in 1 day": [
+            "پگاہ"
+        ],
+        "in 1 month": [
+            "نو ریتھۍ",
+            "next month"
+        ],
+        "in 1 week": [
+            "نو ہفتہ",
+            "next week"
+        ],
+        "in 1 year": [
+            "نو ؤری",
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
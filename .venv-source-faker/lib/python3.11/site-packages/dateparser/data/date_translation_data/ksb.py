@@ -0,0 +1,169 @@
+info = {
+    "name": "ksb",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januali"
+    ],
+    "february": [
+        "feb",
+        "febluali"
+    ],
+    "march": [
+        "mac",
+        "machi"
+    ],
+    "april": [
+        "aplili",
+        "apr"
+    ],
+    "may": [
+        "mei"
+    ],
+    "june": [
+        "jun",
+        "juni"
+    ],
+    "july": [
+        "jul",
+        "julai"
+    ],
+    "august": [
+        "ago",
+        "agosti"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "des",
+        "desemba"
+    ],
+    "monday": [
+        "jtt",
+        "jumaatatu"
+    ],
+    "tuesday": [
+        "jmn",
+        "jumaane"
+    ],
+    "wednesday": [
+        "jtn",
+        "jumaatano"
+    ],
+    "thursday": [
+        "alh",
+        "alhamisi"
+    ],
+    "friday": [
+        "iju",
+        "ijumaa"
+    ],
+    "saturday": [
+        "jmo",
+        "jumaamosi"
+    ],
+    "sunday": [
+        "jpi",
+        "jumaapii"
+    ],
+    "am": [
+        "makeo"
+    ],
+    "pm": [
+        "nyiaghuo"
+    ],
+    "year": [
+        "ng'waka"
+    ],
+    "month": [
+        "ng'ezi"
+    ],
+    "week": [
+        "niki"
+    ],
+    "day": [
+        "siku"
+    ],
+    "hour": [
+        "hr",
+        "saa"
+    ],
+    "minute": [
+        "dakika"
+    ],
+    "second": [
+        "sekunde"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "evi eo"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "ghuo"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "keloi"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
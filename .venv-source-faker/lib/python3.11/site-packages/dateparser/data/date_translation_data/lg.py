@@ -0,0 +1,170 @@
+info = {
+    "name": "lg",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "janwaliyo"
+    ],
+    "february": [
+        "feb",
+        "febwaliyo"
+    ],
+    "march": [
+        "mar",
+        "marisi"
+    ],
+    "april": [
+        "apu",
+        "apuli"
+    ],
+    "may": [
+        "maa",
+        "maayi"
+    ],
+    "june": [
+        "juu",
+        "juuni"
+    ],
+    "july": [
+        "jul",
+        "julaayi"
+    ],
+    "august": [
+        "agu",
+        "agusito"
+    ],
+    "september": [
+        "seb",
+        "sebuttemba"
+    ],
+    "october": [
+        "oki",
+        "okitobba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "des",
+        "desemba"
+    ],
+    "monday": [
+        "bal",
+        "balaza"
+    ],
+    "tuesday": [
+        "lw2",
+        "lwakubiri"
+    ],
+    "wednesday": [
+        "lw3",
+        "lwakusatu"
+    ],
+    "thursday": [
+        "lw4",
+        "lwakuna"
+    ],
+    "friday": [
+        "lw5",
+        "lwakutaano"
+    ],
+    "saturday": [
+        "lw6",
+        "lwamukaaga"
+    ],
+    "sunday": [
+        "sab",
+        "sabbiiti"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "mwaka"
+    ],
+    "month": [
+        "mwezi"
+    ],
+    "week": [
+        "sabbiiti"
+    ],
+    "day": [
+        "lunaku"
+    ],
+    "hour": [
+        "hr",
+        "saawa"
+    ],
+    "minute": [
+        "dakiika"
+    ],
+    "second": [
+        "kasikonda"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "lwaleero"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "ggulo"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "nkya"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
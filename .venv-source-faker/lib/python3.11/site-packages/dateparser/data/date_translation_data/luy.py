@@ -0,0 +1,169 @@
+info = {
+    "name": "luy",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januari"
+    ],
+    "february": [
+        "feb",
+        "februari"
+    ],
+    "march": [
+        "machi",
+        "mar"
+    ],
+    "april": [
+        "apr",
+        "aprili"
+    ],
+    "may": [
+        "mei"
+    ],
+    "june": [
+        "jun",
+        "juni"
+    ],
+    "july": [
+        "jul",
+        "julai"
+    ],
+    "august": [
+        "ago",
+        "agosti"
+    ],
+    "september": [
+        "sep",
+        "septemba"
+    ],
+    "october": [
+        "okt",
+        "oktoba"
+    ],
+    "november": [
+        "nov",
+        "novemba"
+    ],
+    "december": [
+        "des",
+        "desemba"
+    ],
+    "monday": [
+        "j3",
+        "jumatatu"
+    ],
+    "tuesday": [
+        "j4",
+        "jumanne"
+    ],
+    "wednesday": [
+        "j5",
+        "jumatano"
+    ],
+    "thursday": [
+        "al",
+        "murwa wa kanne"
+    ],
+    "friday": [
+        "ij",
+        "murwa wa katano"
+    ],
+    "saturday": [
+        "j1",
+        "jumamosi"
+    ],
+    "sunday": [
+        "j2",
+        "jumapiri"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "muhiga"
+    ],
+    "month": [
+        "mweri"
+    ],
+    "week": [
+        "risiza"
+    ],
+    "day": [
+        "ridiku"
+    ],
+    "hour": [
+        "hr",
+        "isaa"
+    ],
+    "minute": [
+        "idagika"
+    ],
+    "second": [
+        "sekunde"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "lero"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "mgorova"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "mgamba"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,231 @@
+info = {
+    "name": "mt",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "jannar"
+    ],
+    "february": [
+        "fra",
+        "frar"
+    ],
+    "march": [
+        "mar",
+        "marzu"
+    ],
+    "april": [
+        "apr",
+        "april"
+    ],
+    "may": [
+        "mej",
+        "mejju"
+    ],
+    "june": [
+        "ġun",
+        "ġunju"
+    ],
+    "july": [
+        "lul",
+        "lulju"
+    ],
+    "august": [
+        "aww",
+        "awwissu"
+    ],
+    "september": [
+        "set",
+        "settembru"
+    ],
+    "october": [
+        "ott",
+        "ottubru"
+    ],
+    "november": [
+        "nov",
+        "novembru"
+    ],
+    "december": [
+        "diċ",
+        "diċembru"
+    ],
+    "monday": [
+        "it-tnejn",
+        "tne"
+    ],
+    "tuesday": [
+        "it-tlieta",
+        "tli"
+    ],
+    "wednesday": [
+        "erb",
+        "l-erbgħa"
+    ],
+    "thursday": [
+        "il-ħamis",
+        "ħam"
+    ],
+    "friday": [
+        "il-ġimgħa",
+        "ġim"
+    ],
+    "saturday": [
+        "is-sibt",
+        "sib"
+    ],
+    "sunday": [
+        "il-ħadd",
+        "ħad"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "sena",
+        "sn"
+    ],
+    "month": [
+        "xahar"
+    ],
+    "week": [
+        "ġimgħa",
+        "ġm"
+    ],
+    "day": [
+        "jum"
+    ],
+    "hour": [
+        "hr",
+        "siegħa"
+    ],
+    "minute": [
+        "m",
+        "min",
+        "minuta"
+    ],
+    "second": [
+        "s",
+        "sek",
+        "sekonda"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "illum"
+        ],
+        "0 hour ago": [
+            "din is-siegħa",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "din il-minuta",
+            "this minute"
+        ],
+        "0 month ago": [
+            "dan ix-xahar"
+        ],
+        "0 second ago": [
+            "issa",
+            "now"
+        ],
+        "0 week ago": [
+            "din il-ġimgħa"
+        ],
+        "0 year ago": [
+            "din is-sena"
+        ],
+        "1 day ago": [
+            "lbieraħ",
+            "ilbieraħ"
+        ],
+        "1 month ago": [
+            "ix-xahar li għadda"
+        ],
+        "1 week ago": [
+            "il-ġimgħa li għaddiet"
+        ],
+        "1 year ago": [
+            "is-sena l-oħra",
+            "is-sena li għaddiet"
+        ],
+        "in 1 day": [
+            "għada"
+        ],
+        "in 1 month": [
+            "ix-xahar id-dieħel"
+        ],
+        "in 1 week": [
+            "il-ġimgħa d-dieħla"
+        ],
+        "in 1 year": [
+            "is-sena d-dieħla"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) ġurnata ilu"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) siegħa ilu"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) min ilu",
+            "(\\d++[.,]?\\d*+) minuta ilu"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) xahar ilu"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) sek ilu",
+            "(\\d++[.,]?\\d*+) sekonda ilu"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) ġimgħa ilu"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) sena ilu",
+            "(\\d++[.,]?\\d*+) snin ilu"
+        ],
+        "in \\1 day": [
+            "fi żmien (\\d++[.,]?\\d*+) ġurnata oħra"
+        ],
+        "in \\1 hour": [
+            "fi żmien (\\d++[.,]?\\d*+) siegħa"
+        ],
+        "in \\1 minute": [
+            "sa (\\d++[.,]?\\d*+) min oħra",
+            "sa (\\d++[.,]?\\d*+) minuta oħra"
+        ],
+        "in \\1 month": [
+            "fi (\\d++[.,]?\\d*+) xahar oħra",
+            "sa (\\d++[.,]?\\d*+) xahar oħra"
+        ],
+        "in \\1 second": [
+            "sa (\\d++[.,]?\\d*+) sek oħra",
+            "sa (\\d++[.,]?\\d*+) sekonda oħra"
+        ],
+        "in \\1 week": [
+            "sa (\\d++[.,]?\\d*+) ġimgħa oħra"
+        ],
+        "in \\1 year": [
+            "fi żmien (\\d++[.,]?\\d*+) sena oħra"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
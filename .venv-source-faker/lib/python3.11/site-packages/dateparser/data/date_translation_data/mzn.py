@@ -0,0 +1,199 @@
+info = {
+    "name": "mzn",
+    "date_order": "YMD",
+    "january": [
+        "ژانویه"
+    ],
+    "february": [
+        "فوریه"
+    ],
+    "march": [
+        "مارس"
+    ],
+    "april": [
+        "آوریل"
+    ],
+    "may": [
+        "مه"
+    ],
+    "june": [
+        "ژوئن"
+    ],
+    "july": [
+        "ژوئیه"
+    ],
+    "august": [
+        "اوت"
+    ],
+    "september": [
+        "سپتامبر"
+    ],
+    "october": [
+        "اکتبر"
+    ],
+    "november": [
+        "نوامبر"
+    ],
+    "december": [
+        "دسامبر"
+    ],
+    "monday": [
+        "mon"
+    ],
+    "tuesday": [
+        "tue"
+    ],
+    "wednesday": [
+        "wed"
+    ],
+    "thursday": [
+        "thu"
+    ],
+    "friday": [
+        "fri"
+    ],
+    "saturday": [
+        "sat"
+    ],
+    "sunday": [
+        "sun"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "سال"
+    ],
+    "month": [
+        "ماه"
+    ],
+    "week": [
+        "هفته"
+    ],
+    "day": [
+        "روز"
+    ],
+    "hour": [
+        "ساعت",
+        "ساعِت"
+    ],
+    "minute": [
+        "دقیقه",
+        "دَقه"
+    ],
+    "second": [
+        "ثانیه"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "اَمروز"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "این ماه"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "این هفته"
+        ],
+        "0 year ago": [
+            "امسال"
+        ],
+        "1 day ago": [
+            "دیروز"
+        ],
+        "1 month ago": [
+            "ماه قبل"
+        ],
+        "1 week ago": [
+            "قبلی هفته"
+        ],
+        "1 year ago": [
+            "پارسال"
+        ],
+        "in 1 day": [
+            "فِردا"
+        ],
+        "in 1 month": [
+            "ماه ِبعد"
+        ],
+        "in 1 week": [
+            "بعدی هفته"
+        ],
+        "in 1 year": [
+            "سال دیگه"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) روز پیش"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) ساعت پیش",
+            "(\\d++[.,]?\\d*+) ساعِت پیش"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) دَقه پیش"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) ماه پیش"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) ثانیه پیش"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) هفته پیش"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) سال پیش"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) روز دله"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) ساعت دله",
+            "(\\d++[.,]?\\d*+) ساعِت دله"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) دقیقه دله",
+            "(\\d++[.,]?\\d*+) دَقه دله"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) ماه دله"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) ثانیه دله"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) هفته دله"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) سال دله"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
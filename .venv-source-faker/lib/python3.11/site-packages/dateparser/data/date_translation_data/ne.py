@@ -0,0 +1,214 @@
+info = {
+    "name": "ne",
+    "date_order": "YMD",
+    "january": [
+        "जनवरी"
+    ],
+    "february": [
+        "फेब्रुअरी"
+    ],
+    "march": [
+        "मार्च"
+    ],
+    "april": [
+        "अप्रिल"
+    ],
+    "may": [
+        "मे",
+        "मई"
+    ],
+    "june": [
+        "जुन"
+    ],
+    "july": [
+        "जुलाई"
+    ],
+    "august": [
+        "अगस्ट"
+    ],
+    "september": [
+        "सेप्टेम्बर"
+    ],
+    "october": [
+        "अक्टोबर"
+    ],
+    "november": [
+        "नोभेम्बर"
+    ],
+    "december": [
+        "डिसेम्बर"
+    ],
+    "monday": [
+        "सोम",
+        "सोमबार"
+    ],
+    "tuesday": [
+        "मङ्गल",
+        "मङ्गलबार"
+    ],
+    "wednesday": [
+        "बुध",
+        "बुधबार"
+    ],
+    "thursday": [
+        "बिहि",
+        "बिहिबार"
+    ],
+    "friday": [
+        "शुक्र",
+        "शुक्रबार"
+    ],
+    "saturday": [
+        "शनि",
+        "शनिबार"
+    ],
+    "sunday": [
+        "आइत",
+        "आइतबार"
+    ],
+    "am": [
+        "पूर्वाह्न"
+    ],
+    "pm": [
+        "अपराह्न"
+    ],
+    "year": [
+        "वर्ष",
+        "बर्ष"
+    ],
+    "month": [
+        "महिना"
+    ],
+    "week": [
+        "हप्ता"
+    ],
+    "day": [
+        "बार"
+    ],
+    "hour": [
+        "घण्टा"
+    ],
+    "minute": [
+        "मिनेट"
+    ],
+    "second": [
+        "सेकेन्ड"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "आज"
+        ],
+        "0 hour ago": [
+            "यस घडीमा",
+            "यो घडीमा"
+        ],
+        "0 minute ago": [
+            "यही मिनेटमा"
+        ],
+        "0 month ago": [
+            "यो महिना"
+        ],
+        "0 second ago": [
+            "अहिले",
+            "अब"
+        ],
+        "0 week ago": [
+            "यो हप्ता"
+        ],
+        "0 year ago": [
+            "यो वर्ष"
+        ],
+        "1 day ago": [
+            "हिजो"
+        ],
+        "1 month ago": [
+            "गत महिना"
+        ],
+        "1 week ago": [
+            "गत हप्ता"
+        ],
+        "1 year ago": [
+            "गत वर्ष"
+        ],
+        "in 1 day": [
+            "भोलि"
+        ],
+        "in 1 month": [
+            "अर्को महिना",
+            "आगामी महिना"
+        ],
+        "in 1 week": [
+            "आगामी हप्ता",
+            "आउने हप्ता"
+        ],
+        "in 1 year": [
+            "आगामी वर्ष",
+            "अर्को वर्ष"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) दिन पहिले"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) घण्टा पहिले"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) मिनेट पहिले"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) महिना पहिले"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) सेकेन्ड पहिले",
+            "(\\d++[.,]?\\d*+) सेकेण्ड पहिले"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) हप्ता पहिले"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) वर्ष अघि"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) दिनमा"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) घण्टामा"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) मिनेटमा"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) महिनामा"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) सेकेन्डमा",
+            "(\\d++[.,]?\\d*+) सेकेण्डमा"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) हप्तामा"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) वर्षमा"
+        ]
+    },
+    "locale_specific": {
+        "ne-IN": {
+            "name": "ne-IN"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,288 @@
+info = {
+    "name": "nn",
+    "date_order": "DMY",
+    "january": [
+        "jan",
+        "januar"
+    ],
+    "february": [
+        "feb",
+        "februar"
+    ],
+    "march": [
+        "mar",
+        "mars"
+    ],
+    "april": [
+        "apr",
+        "april"
+    ],
+    "may": [
+        "mai"
+    ],
+    "june": [
+        "jun",
+        "juni"
+    ],
+    "july": [
+        "jul",
+        "juli"
+    ],
+    "august": [
+        "aug",
+        "august"
+    ],
+    "september": [
+        "sep",
+        "september"
+    ],
+    "october": [
+        "okt",
+        "oktober"
+    ],
+    "november": [
+        "nov",
+        "november"
+    ],
+    "december": [
+        "des",
+        "desember"
+    ],
+    "monday": [
+        "må",
+        "mån",
+        "måndag"
+    ],
+    "tuesday": [
+        "ty",
+        "tys",
+        "tysdag"
+    ],
+    "wednesday": [
+        "on",
+        "ons",
+        "onsdag"
+    ],
+    "thursday": [
+        "to",
+        "tor",
+        "torsdag"
+    ],
+    "friday": [
+        "fr",
+        "fre",
+        "fredag"
+    ],
+    "saturday": [
+        "la",
+        "lau",
+        "laurdag"
+    ],
+    "sunday": [
+        "sø",
+        "søn",
+        "søndag"
+    ],
+    "am": [
+        "fm",
+        "formiddag"
+    ],
+    "pm": [
+        "em",
+        "ettermiddag"
+    ],
+    "year": [
+        "år"
+    ],
+    "month": [
+        "md",
+        "månad"
+    ],
+    "week": [
+        "v",
+        "veke"
+    ],
+    "day": [
+        "d",
+        "dag"
+    ],
+    "hour": [
+        "t",
+        "timar",
+        "time"
+    ],
+    "minute": [
+        "m",
+        "min",
+        "minutt"
+    ],
+    "second": [
+        "s",
+        "sek",
+        "sekund"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "i dag"
+        ],
+        "0 hour ago": [
+            "denne timen",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "dette minuttet",
+            "this minute"
+        ],
+        "0 month ago": [
+            "denne md",
+            "denne månaden",
+            "this month"
+        ],
+        "0 second ago": [
+            "no",
+            "now"
+        ],
+        "0 week ago": [
+            "denne veka",
+            "this week"
+        ],
+        "0 year ago": [
+            "i år",
+            "this year"
+        ],
+        "1 day ago": [
+            "i går"
+        ],
+        "1 month ago": [
+            "førre md",
+            "førre månad",
+            "last month"
+        ],
+        "1 week ago": [
+            "førre veke",
+            "last week"
+        ],
+        "1 year ago": [
+            "i fjor",
+            "last year"
+        ],
+        "in 1 day": [
+            "i morgon"
+        ],
+        "in 1 month": [
+            "neste md",
+            "neste månad",
+            "next month"
+        ],
+        "in 1 week": [
+            "neste veke",
+            "next week"
+        ],
+        "in 1 year": [
+            "neste år",
+            "next year"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "for (\\d++[.,]?\\d*+) d sidan",
+            "for (\\d++[.,]?\\d*+) døgn sidan",
+            "–(\\d++[.,]?\\d*+) d",
+            "for (\\d++[.,]?\\d*+) døgn siden"
+        ],
+        "\\1 hour ago": [
+            "for (\\d++[.,]?\\d*+) t sidan",
+            "for (\\d++[.,]?\\d*+) timar sidan",
+            "for (\\d++[.,]?\\d*+) time sidan",
+            "–(\\d++[.,]?\\d*+) t",
+            "for (\\d++[.,]?\\d*+) time siden",
+            "for (\\d++[.,]?\\d*+) timer siden"
+        ],
+        "\\1 minute ago": [
+            "for (\\d++[.,]?\\d*+) min sidan",
+            "for (\\d++[.,]?\\d*+) minutt sidan",
+            "–(\\d++[.,]?\\d*+) min",
+            "for (\\d++[.,]?\\d*+) minutt siden",
+            "for (\\d++[.,]?\\d*+) minutter siden"
+        ],
+        "\\1 month ago": [
+            "for (\\d++[.,]?\\d*+) md sidan",
+            "for (\\d++[.,]?\\d*+) månad sidan",
+            "for (\\d++[.,]?\\d*+) månadar sidan",
+            "–(\\d++[.,]?\\d*+) md",
+            "for (\\d++[.,]?\\d*+) måned siden",
+            "for (\\d++[.,]?\\d*+) måneder siden"
+        ],
+        "\\1 second ago": [
+            "for (\\d++[.,]?\\d*+) sek sidan",
+            "for (\\d++[.,]?\\d*+) sekund sidan",
+            "–(\\d++[.,]?\\d*+) s",
+            "for (\\d++[.,]?\\d*+) sekund siden",
+            "for (\\d++[.,]?\\d*+) sekunder siden"
+        ],
+        "\\1 week ago": [
+            "for (\\d++[.,]?\\d*+) v sidan",
+            "for (\\d++[.,]?\\d*+) veke sidan",
+            "for (\\d++[.,]?\\d*+) veker sidan",
+            "–(\\d++[.,]?\\d*+) v",
+            "for (\\d++[.,]?\\d*+) uke siden",
+            "for (\\d++[.,]?\\d*+) uker siden"
+        ],
+        "\\1 year ago": [
+            "for (\\d++[.,]?\\d*+) år sidan",
+            "for (\\d++[.,]?\\d*+) år siden"
+        ],
+        "in \\1 day": [
+            "om (\\d++[.,]?\\d*+) d",
+            "om (\\d++[.,]?\\d*+) døgn"
+        ],
+        "in \\1 hour": [
+            "om (\\d++[.,]?\\d*+) t",
+            "om (\\d++[.,]?\\d*+) timar",
+            "om (\\d++[.,]?\\d*+) time",
+            "om (\\d++[.,]?\\d*+) timer"
+        ],
+        "in \\1 minute": [
+            "om (\\d++[.,]?\\d*+) min",
+            "om (\\d++[.,]?\\d*+) minutt",
+            "om (\\d++[.,]?\\d*+) minutter"
+        ],
+        "in \\1 month": [
+            "om (\\d++[.,]?\\d*+) md",
+            "om (\\d++[.,]?\\d*+) månad",
+            "om (\\d++[.,]?\\d*+) månadar",
+            "om (\\d++[.,]?\\d*+) måned",
+            "om (\\d++[.,]?\\d*+) måneder"
+        ],
+        "in \\1 second": [
+            "om (\\d++[.,]?\\d*+) sek",
+            "om (\\d++[.,]?\\d*+) sekund",
+            "om (\\d++[.,]?\\d*+) sekunder"
+        ],
+        "in \\1 week": [
+            "om (\\d++[.,]?\\d*+) v",
+            "om (\\d++[.,]?\\d*+) veke",
+            "om (\\d++[.,]?\\d*+) veker",
+            "om (\\d++[.,]?\\d*+) uke",
+            "om (\\d++[.,]?\\d*+) uker"
+        ],
+        "in \\1 year": [
+            "om (\\d++[.,]?\\d*+) år"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
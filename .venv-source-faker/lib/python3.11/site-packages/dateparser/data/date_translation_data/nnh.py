@@ -0,0 +1,151 @@
+info = {
+    "name": "nnh",
+    "date_order": "DMY",
+    "january": [
+        "saŋ tsetsɛ̀ɛ lùm"
+    ],
+    "february": [
+        "saŋ kàg ngwóŋ"
+    ],
+    "march": [
+        "saŋ lepyè shúm"
+    ],
+    "april": [
+        "saŋ cÿó"
+    ],
+    "may": [
+        "saŋ tsɛ̀ɛ cÿó"
+    ],
+    "june": [
+        "saŋ njÿolá'"
+    ],
+    "july": [
+        "saŋ tyɛ̀b tyɛ̀b mbʉ̀ŋ"
+    ],
+    "august": [
+        "saŋ mbʉ̀ŋ"
+    ],
+    "september": [
+        "saŋ ngwɔ̀' mbÿɛ"
+    ],
+    "october": [
+        "saŋ tàŋa tsetsá'"
+    ],
+    "november": [
+        "saŋ mejwoŋó"
+    ],
+    "december": [
+        "saŋ lùm"
+    ],
+    "monday": [
+        "mvfò lyɛ̌'"
+    ],
+    "tuesday": [
+        "mbɔ́ɔntè mvfò lyɛ̌'"
+    ],
+    "wednesday": [
+        "tsètsɛ̀ɛ lyɛ̌'"
+    ],
+    "thursday": [
+        "mbɔ́ɔntè tsetsɛ̀ɛ lyɛ̌'"
+    ],
+    "friday": [
+        "mvfò màga lyɛ̌'"
+    ],
+    "saturday": [
+        "màga lyɛ̌'"
+    ],
+    "sunday": [
+        "lyɛ'ɛ́ sẅíŋtè"
+    ],
+    "am": [
+        "mba'ámba'"
+    ],
+    "pm": [
+        "ncwònzém"
+    ],
+    "year": [
+        "ngù'"
+    ],
+    "month": [
+        "month"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "lyɛ̌'"
+    ],
+    "hour": [
+        "fʉ̀' nèm",
+        "hr"
+    ],
+    "minute": [
+        "minute"
+    ],
+    "second": [
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "lyɛ̌'ɔɔn"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "jǔɔ gẅie à ka tɔ̌g"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "jǔɔ gẅie à ne ntóo"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,222 @@
+info = {
+    "name": "pa",
+    "date_order": "DMY",
+    "january": [
+        "ਜਨ",
+        "ਜਨਵਰੀ"
+    ],
+    "february": [
+        "ਫ਼ਰ",
+        "ਫ਼ਰਵਰੀ"
+    ],
+    "march": [
+        "ਮਾਰਚ"
+    ],
+    "april": [
+        "ਅਪ੍ਰੈ",
+        "ਅਪ੍ਰੈਲ"
+    ],
+    "may": [
+        "ਮਈ"
+    ],
+    "june": [
+        "ਜੂਨ"
+    ],
+    "july": [
+        "ਜੁਲਾ",
+        "ਜੁਲਾਈ"
+    ],
+    "august": [
+        "ਅਗ",
+        "ਅਗਸਤ"
+    ],
+    "september": [
+        "ਸਤੰ",
+        "ਸਤੰਬਰ"
+    ],
+    "october": [
+        "ਅਕਤੂ",
+        "ਅਕਤੂਬਰ"
+    ],
+    "november": [
+        "ਨਵੰ",
+        "ਨਵੰਬਰ"
+    ],
+    "december": [
+        "ਦਸੰ",
+        "ਦਸੰਬਰ"
+    ],
+    "monday": [
+        "ਸੋਮ",
+        "ਸੋਮਵਾਰ"
+    ],
+    "tuesday": [
+        "ਮੰਗਲ",
+        "ਮੰਗਲਵਾਰ"
+    ],
+    "wednesday": [
+        "ਬੁੱਧ",
+        "ਬੁੱਧਵਾਰ"
+    ],
+    "thursday": [
+        "ਵੀਰ",
+        "ਵੀਰਵਾਰ"
+    ],
+    "friday": [
+        "ਸ਼ੁੱਕਰ",
+        "ਸ਼ੁੱਕਰਵਾਰ"
+    ],
+    "saturday": [
+        "ਸ਼ਨਿੱਚਰ",
+        "ਸ਼ਨਿੱਚਰਵਾਰ"
+    ],
+    "sunday": [
+        "ਐਤ",
+        "ਐਤਵਾਰ"
+    ],
+    "am": [
+        "ਪੂਦੁ"
+    ],
+    "pm": [
+        "ਬਾਦੁ"
+    ],
+    "year": [
+        "ਸਾਲ"
+    ],
+    "month": [
+        "ਮਹੀਨਾ"
+    ],
+    "week": [
+        "ਹਫ਼ਤਾ"
+    ],
+    "day": [
+        "ਦਿਨ"
+    ],
+    "hour": [
+        "ਘੰ",
+        "ਘੰਟਾ",
+        "ਘੰਟੇ"
+    ],
+    "minute": [
+        "ਮਿੰਟ"
+    ],
+    "second": [
+        "ਸਕਿੰਟ"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "ਅੱਜ"
+        ],
+        "0 hour ago": [
+            "ਇਸ ਘੰਟੇ"
+        ],
+        "0 minute ago": [
+            "ਇਸ ਮਿੰਟ"
+        ],
+        "0 month ago": [
+            "ਇਹ ਮਹੀਨਾ"
+        ],
+        "0 second ago": [
+            "ਹੁਣ"
+        ],
+        "0 week ago": [
+            "ਇਹ ਹਫ਼ਤਾ"
+        ],
+        "0 year ago": [
+            "ਇਹ ਸਾਲ"
+        ],
+        "1 day ago": [
+            "ਬੀਤਿਆ ਕੱਲ੍ਹ"
+        ],
+        "1 month ago": [
+            "ਪਿਛਲਾ ਮਹੀਨਾ"
+        ],
+        "1 week ago": [
+            "ਪਿਛਲਾ ਹਫ਼ਤਾ"
+        ],
+        "1 year ago": [
+            "ਪਿਛਲਾ ਸਾਲ"
+        ],
+        "in 1 day": [
+            "ਭਲਕੇ"
+        ],
+        "in 1 month": [
+            "ਅਗਲਾ ਮਹੀਨਾ"
+        ],
+        "in 1 week": [
+            "ਅਗਲਾ ਹਫ਼ਤਾ"
+        ],
+        "in 1 year": [
+            "ਅਗਲਾ ਸਾਲ"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) ਦਿਨ ਪਹਿਲਾਂ"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) ਘੰਟਾ ਪਹਿਲਾਂ",
+            "(\\d++[.,]?\\d*+) ਘੰਟੇ ਪਹਿਲਾਂ"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) ਮਿੰਟ ਪਹਿਲਾਂ"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) ਮਹੀਨਾ ਪਹਿਲਾਂ",
+            "(\\d++[.,]?\\d*+) ਮਹੀਨੇ ਪਹਿਲਾਂ"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) ਸਕਿੰਟ ਪਹਿਲਾਂ"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) ਹਫ਼ਤਾ ਪਹਿਲਾਂ",
+            "(\\d++[.,]?\\d*+) ਹਫ਼ਤੇ ਪਹਿਲਾਂ"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) ਸਾਲ ਪਹਿਲਾਂ"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) ਦਿਨ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਦਿਨਾਂ ਵਿੱਚ"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) ਘੰਟਿਆਂ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਘੰਟੇ ਵਿੱਚ"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) ਮਿੰਟ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਮਿੰਟਾਂ ਵਿੱਚ"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) ਮਹੀਨਿਆਂ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਮਹੀਨੇ ਵਿੱਚ"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) ਸਕਿੰਟ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਸਕਿੰਟਾਂ ਵਿੱਚ"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) ਹਫ਼ਤਿਆਂ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਹਫ਼ਤੇ ਵਿੱਚ"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) ਸਾਲ ਵਿੱਚ",
+            "(\\d++[.,]?\\d*+) ਸਾਲਾਂ ਵਿੱਚ"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
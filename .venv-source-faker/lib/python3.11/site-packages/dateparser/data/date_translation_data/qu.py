@@ -0,0 +1,215 @@
+info = {
+    "name": "qu",
+    "date_order": "DMY",
+    "january": [
+        "ene",
+        "enero",
+        "qul",
+        "qulla puquy"
+    ],
+    "february": [
+        "feb",
+        "febrero",
+        "hat",
+        "hatun puquy"
+    ],
+    "march": [
+        "mar",
+        "marzo",
+        "pau",
+        "pauqar waray"
+    ],
+    "april": [
+        "abr",
+        "abril",
+        "ayr",
+        "ayriwa"
+    ],
+    "may": [
+        "may",
+        "mayo",
+        "aym",
+        "aymuray"
+    ],
+    "june": [
+        "jun",
+        "junio",
+        "int",
+        "inti raymi"
+    ],
+    "july": [
+        "jul",
+        "julio",
+        "ant",
+        "anta sitwa"
+    ],
+    "august": [
+        "ago",
+        "agosto",
+        "qha",
+        "qhapaq sitwa"
+    ],
+    "september": [
+        "set",
+        "setiembre",
+        "uma",
+        "uma raymi"
+    ],
+    "october": [
+        "oct",
+        "octubre",
+        "kan",
+        "kantaray"
+    ],
+    "november": [
+        "nov",
+        "noviembre",
+        "aya",
+        "ayamarq'a"
+    ],
+    "december": [
+        "dic",
+        "diciembre",
+        "kap",
+        "kapaq raymi"
+    ],
+    "monday": [
+        "lun",
+        "lunes"
+    ],
+    "tuesday": [
+        "mar",
+        "martes"
+    ],
+    "wednesday": [
+        "mié",
+        "miércoles"
+    ],
+    "thursday": [
+        "jue",
+        "jueves"
+    ],
+    "friday": [
+        "vie",
+        "viernes"
+    ],
+    "saturday": [
+        "sab",
+        "sábado"
+    ],
+    "sunday": [
+        "dom",
+        "domingo"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "year"
+    ],
+    "month": [
+        "month"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "day"
+    ],
+    "hour": [
+        "hora",
+        "hour"
+    ],
+    "minute": [
+        "minute"
+    ],
+    "second": [
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "kunan punchaw",
+            "today"
+        ],
+        "0 hour ago": [
+            "kay hora",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "kay minuto",
+            "this minute"
+        ],
+        "0 month ago": [
+            "kunan killa",
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "kunan semana",
+            "this week"
+        ],
+        "0 year ago": [
+            "kunan wata",
+            "this year"
+        ],
+        "1 day ago": [
+            "qayna punchaw",
+            "yesterday"
+        ],
+        "1 month ago": [
+            "qayna killa",
+            "last month"
+        ],
+        "1 week ago": [
+            "qayna semana",
+            "last week"
+        ],
+        "1 year ago": [
+            "qayna wata",
+            "last year"
+        ],
+        "in 1 day": [
+            "paqarin",
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "hamuq killa",
+            "next month"
+        ],
+        "in 1 week": [
+            "hamuq semana",
+            "next week"
+        ],
+        "in 1 year": [
+            "hamuq wata",
+            "next year"
+        ]
+    },
+    "locale_specific": {
+        "qu-BO": {
+            "name": "qu-BO"
+        },
+        "qu-EC": {
+            "name": "qu-EC"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,186 @@
+info = {
+    "name": "rm",
+    "date_order": "DMY",
+    "january": [
+        "da schaner",
+        "schan",
+        "schaner"
+    ],
+    "february": [
+        "da favrer",
+        "favr",
+        "favrer"
+    ],
+    "march": [
+        "da mars",
+        "mars"
+    ],
+    "april": [
+        "avr",
+        "avrigl",
+        "d'avrigl"
+    ],
+    "may": [
+        "da matg",
+        "matg"
+    ],
+    "june": [
+        "da zercladur",
+        "zercl",
+        "zercladur"
+    ],
+    "july": [
+        "da fanadur",
+        "fan",
+        "fanadur"
+    ],
+    "august": [
+        "avust",
+        "d'avust"
+    ],
+    "september": [
+        "da settember",
+        "sett",
+        "settember"
+    ],
+    "october": [
+        "d'october",
+        "oct",
+        "october"
+    ],
+    "november": [
+        "da november",
+        "nov",
+        "november"
+    ],
+    "december": [
+        "da december",
+        "dec",
+        "december"
+    ],
+    "monday": [
+        "gli",
+        "glindesdi"
+    ],
+    "tuesday": [
+        "ma",
+        "mardi"
+    ],
+    "wednesday": [
+        "me",
+        "mesemna"
+    ],
+    "thursday": [
+        "gie",
+        "gievgia"
+    ],
+    "friday": [
+        "ve",
+        "venderdi"
+    ],
+    "saturday": [
+        "so",
+        "sonda"
+    ],
+    "sunday": [
+        "du",
+        "dumengia"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "onn"
+    ],
+    "month": [
+        "mais"
+    ],
+    "week": [
+        "emna"
+    ],
+    "day": [
+        "d",
+        "di",
+        "tag"
+    ],
+    "hour": [
+        "ura",
+        "uras"
+    ],
+    "minute": [
+        "min",
+        "minuta"
+    ],
+    "second": [
+        "s",
+        "secunda"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "oz"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "quest onn",
+            "this year"
+        ],
+        "1 day ago": [
+            "ier"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "l'onn passà",
+            "last year"
+        ],
+        "in 1 day": [
+            "damaun"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "l'onn proxim",
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,220 @@
+info = {
+    "name": "si",
+    "date_order": "YMD",
+    "january": [
+        "ජන",
+        "ජනවාරි"
+    ],
+    "february": [
+        "පෙබ",
+        "පෙබරවාරි"
+    ],
+    "march": [
+        "මාර්",
+        "මාර්තු"
+    ],
+    "april": [
+        "අප්‍රේල්"
+    ],
+    "may": [
+        "මැයි"
+    ],
+    "june": [
+        "ජූනි"
+    ],
+    "july": [
+        "ජූලි"
+    ],
+    "august": [
+        "අගෝ",
+        "අගෝස්තු"
+    ],
+    "september": [
+        "සැප්",
+        "සැප්තැම්බර්"
+    ],
+    "october": [
+        "ඔක්",
+        "ඔක්තෝබර්"
+    ],
+    "november": [
+        "නොවැ",
+        "නොවැම්බර්"
+    ],
+    "december": [
+        "දෙසැ",
+        "දෙසැම්බර්"
+    ],
+    "monday": [
+        "සඳුදා"
+    ],
+    "tuesday": [
+        "අඟහ",
+        "අඟහරුවාදා"
+    ],
+    "wednesday": [
+        "බදාදා"
+    ],
+    "thursday": [
+        "බ්‍රහස්",
+        "බ්‍රහස්පතින්දා"
+    ],
+    "friday": [
+        "සිකු",
+        "සිකුරාදා"
+    ],
+    "saturday": [
+        "සෙන",
+        "සෙනසුරාදා"
+    ],
+    "sunday": [
+        "ඉරිදා"
+    ],
+    "am": [
+        "පෙව"
+    ],
+    "pm": [
+        "පව"
+    ],
+    "year": [
+        "වර්",
+        "වර්ෂය"
+    ],
+    "month": [
+        "මාස",
+        "මාසය"
+    ],
+    "week": [
+        "සති",
+        "සතිය"
+    ],
+    "day": [
+        "දිනය"
+    ],
+    "hour": [
+        "පැය",
+        "පැ"
+    ],
+    "minute": [
+        "මිනි",
+        "මිනිත්තුව",
+        "මි"
+    ],
+    "second": [
+        "තත්",
+        "තත්පරය",
+        "ත"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "අද"
+        ],
+        "0 hour ago": [
+            "මෙම පැය"
+        ],
+        "0 minute ago": [
+            "මෙම මිනිත්තුව"
+        ],
+        "0 month ago": [
+            "මෙම මාස",
+            "මෙම මාසය"
+        ],
+        "0 second ago": [
+            "දැන්"
+        ],
+        "0 week ago": [
+            "මෙම සති",
+            "මෙම සතිය"
+        ],
+        "0 year ago": [
+            "මෙම වසර"
+        ],
+        "1 day ago": [
+            "ඊයේ"
+        ],
+        "1 month ago": [
+            "පසුගිය මාස",
+            "පසුගිය මාසය"
+        ],
+        "1 week ago": [
+            "පසුගිය සති",
+            "පසුගිය සතිය"
+        ],
+        "1 year ago": [
+            "පසුගිය වසර"
+        ],
+        "in 1 day": [
+            "හෙට"
+        ],
+        "in 1 month": [
+            "ඊළඟ මාස",
+            "ඊළඟ මාසය"
+        ],
+        "in 1 week": [
+            "ඊළඟ සති",
+            "ඊළඟ සතිය"
+        ],
+        "in 1 year": [
+            "ඊළඟ වසර"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "දින (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 hour ago": [
+            "පැය (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 minute ago": [
+            "මිනිත්තු (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 month ago": [
+            "මාස (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 second ago": [
+            "තත්පර (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 week ago": [
+            "සති (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "\\1 year ago": [
+            "වසර (\\d++[.,]?\\d*+)කට පෙර"
+        ],
+        "in \\1 day": [
+            "දින (\\d++[.,]?\\d*+)න්"
+        ],
+        "in \\1 hour": [
+            "පැය (\\d++[.,]?\\d*+)කින්"
+        ],
+        "in \\1 minute": [
+            "මිනිත්තු (\\d++[.,]?\\d*+)කින්"
+        ],
+        "in \\1 month": [
+            "මාස (\\d++[.,]?\\d*+)කින්"
+        ],
+        "in \\1 second": [
+            "තත්පර (\\d++[.,]?\\d*+)කින්"
+        ],
+        "in \\1 week": [
+            "සති (\\d++[.,]?\\d*+)කින්"
+        ],
+        "in \\1 year": [
+            "වසර (\\d++[.,]?\\d*+)කින්"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,309 @@
+info = {
+    "name": "so",
+    "date_order": "DMY",
+    "january": [
+        "bisha koobaad",
+        "jan",
+        "jannaayo",
+        "kob"
+    ],
+    "february": [
+        "bisha labaad",
+        "feb",
+        "febraayo",
+        "lab"
+    ],
+    "march": [
+        "bisha saddexaad",
+        "maarso",
+        "mar",
+        "sad"
+    ],
+    "april": [
+        "abr",
+        "abriil",
+        "bisha afraad",
+        "afr"
+    ],
+    "may": [
+        "bisha shanaad",
+        "may",
+        "sha"
+    ],
+    "june": [
+        "bisha lixaad",
+        "jun",
+        "juun",
+        "lix"
+    ],
+    "july": [
+        "bisha todobaad",
+        "lul",
+        "luuliyo",
+        "tod"
+    ],
+    "august": [
+        "bisha sideedaad",
+        "ogosto",
+        "ogs",
+        "sid"
+    ],
+    "september": [
+        "bisha sagaalaad",
+        "seb",
+        "sebteembar",
+        "sag"
+    ],
+    "october": [
+        "bisha tobnaad",
+        "okt",
+        "oktoobar",
+        "tob"
+    ],
+    "november": [
+        "bisha kow iyo tobnaad",
+        "nof",
+        "noofeembar",
+        "kit"
+    ],
+    "december": [
+        "bisha laba iyo tobnaad",
+        "dis",
+        "diseembar",
+        "lit"
+    ],
+    "monday": [
+        "isn",
+        "isniin"
+    ],
+    "tuesday": [
+        "talaado",
+        "tldo",
+        "tal"
+    ],
+    "wednesday": [
+        "arbaco",
+        "arbc",
+        "arb"
+    ],
+    "thursday": [
+        "khamiis",
+        "khms",
+        "kha"
+    ],
+    "friday": [
+        "jimco",
+        "jmc",
+        "jim"
+    ],
+    "saturday": [
+        "sabti",
+        "sbti",
+        "sab"
+    ],
+    "sunday": [
+        "axad",
+        "axd"
+    ],
+    "am": [
+        "am",
+        "gh",
+        "sn"
+    ],
+    "pm": [
+        "gd",
+        "gn"
+    ],
+    "year": [
+        "sannad",
+        "snd",
+        "year"
+    ],
+    "month": [
+        "bil",
+        "month"
+    ],
+    "week": [
+        "tdbd",
+        "toddobaad",
+        "week"
+    ],
+    "day": [
+        "maalin",
+        "mln",
+        "day"
+    ],
+    "hour": [
+        "saacad",
+        "saacado",
+        "scd",
+        "hour"
+    ],
+    "minute": [
+        "daqiiqad",
+        "dqqd",
+        "minute"
+    ],
+    "second": [
+        "ilbiriqsi",
+        "ilbrqsi",
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "maanta"
+        ],
+        "0 hour ago": [
+            "saacadan",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "daqiiqadan",
+            "this minute"
+        ],
+        "0 month ago": [
+            "bishan",
+            "this month"
+        ],
+        "0 second ago": [
+            "imika",
+            "iminka",
+            "now"
+        ],
+        "0 week ago": [
+            "toddobaadkan",
+            "usbuucan",
+            "this week"
+        ],
+        "0 year ago": [
+            "sannadkan",
+            "this year"
+        ],
+        "1 day ago": [
+            "shalay"
+        ],
+        "1 month ago": [
+            "bishii hore",
+            "last month"
+        ],
+        "1 week ago": [
+            "toddobaadkii hore",
+            "last week"
+        ],
+        "1 year ago": [
+            "sannadkii hore",
+            "sannadkii la soo dhaafay",
+            "last year"
+        ],
+        "in 1 day": [
+            "berri"
+        ],
+        "in 1 month": [
+            "bisha danbe",
+            "next month"
+        ],
+        "in 1 week": [
+            "toddobaadka danbe",
+            "next week"
+        ],
+        "in 1 year": [
+            "sannadka danbe",
+            "sannadka xiga",
+            "next year"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) maalin kahor",
+            "(\\d++[.,]?\\d*+) maalmood kahor",
+            "(\\d++[.,]?\\d*+) mlmd khr",
+            "(\\d++[.,]?\\d*+) mln khr"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) saacad kahor",
+            "(\\d++[.,]?\\d*+) saacadood kahor",
+            "(\\d++[.,]?\\d*+) scd khr"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) daqiiqad kahor",
+            "(\\d++[.,]?\\d*+) daqiiqadood kahor",
+            "(\\d++[.,]?\\d*+) dqqd khr"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) bil kahor",
+            "(\\d++[.,]?\\d*+) bil khr",
+            "(\\d++[.,]?\\d*+) bilood kahor"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) ilbiriqsi kahor",
+            "(\\d++[.,]?\\d*+) ilbrqsi khr"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) tdbd khr",
+            "(\\d++[.,]?\\d*+) toddobaad kahor"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) sannad kahor",
+            "(\\d++[.,]?\\d*+) sannadood kahor",
+            "(\\d++[.,]?\\d*+) snd khr"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) maalin",
+            "(\\d++[.,]?\\d*+) maalmood",
+            "(\\d++[.,]?\\d*+) mlmd",
+            "(\\d++[.,]?\\d*+) mln"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) saacad",
+            "(\\d++[.,]?\\d*+) saacadood",
+            "(\\d++[.,]?\\d*+) scd"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) daqiidadood",
+            "(\\d++[.,]?\\d*+) daqiiqad",
+            "(\\d++[.,]?\\d*+) dqqd"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) bil",
+            "(\\d++[.,]?\\d*+) bilood"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) ilbiriqsi",
+            "(\\d++[.,]?\\d*+) ilbrqsi"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) tdbd",
+            "(\\d++[.,]?\\d*+) toddobaad"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) sannad",
+            "(\\d++[.,]?\\d*+) sannadood",
+            "(\\d++[.,]?\\d*+) snd"
+        ]
+    },
+    "locale_specific": {
+        "so-DJ": {
+            "name": "so-DJ"
+        },
+        "so-ET": {
+            "name": "so-ET"
+        },
+        "so-KE": {
+            "name": "so-KE"
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,239 @@
+info = {
+    "name": "to",
+    "date_order": "DMY",
+    "january": [
+        "sān",
+        "sānuali"
+    ],
+    "february": [
+        "fēp",
+        "fēpueli"
+    ],
+    "march": [
+        "ma'a",
+        "ma'asi"
+    ],
+    "april": [
+        "'epe",
+        "'epeleli"
+    ],
+    "may": [
+        "mē"
+    ],
+    "june": [
+        "sun",
+        "sune"
+    ],
+    "july": [
+        "siu",
+        "siulai"
+    ],
+    "august": [
+        "'aok",
+        "'aokosi"
+    ],
+    "september": [
+        "sepitema",
+        "sēp",
+        "sēpitema",
+        "sep"
+    ],
+    "october": [
+        "'oka",
+        "'okatopa"
+    ],
+    "november": [
+        "nōv",
+        "nōvema"
+    ],
+    "december": [
+        "tīs",
+        "tīsema"
+    ],
+    "monday": [
+        "mōn",
+        "mōnite"
+    ],
+    "tuesday": [
+        "tūs",
+        "tūsite"
+    ],
+    "wednesday": [
+        "pul",
+        "pulelulu"
+    ],
+    "thursday": [
+        "tu'a",
+        "tu'apulelulu"
+    ],
+    "friday": [
+        "fal",
+        "falaite"
+    ],
+    "saturday": [
+        "tok",
+        "tokonaki"
+    ],
+    "sunday": [
+        "sāp",
+        "sāpate"
+    ],
+    "am": [
+        "hengihengi",
+        "hh",
+        "am"
+    ],
+    "pm": [
+        "ea",
+        "efiafi",
+        "pm"
+    ],
+    "year": [
+        "t",
+        "ta'u"
+    ],
+    "month": [
+        "mh",
+        "māhina"
+    ],
+    "week": [
+        "ui",
+        "uike"
+    ],
+    "day": [
+        "'a",
+        "'aho"
+    ],
+    "hour": [
+        "h",
+        "houa"
+    ],
+    "minute": [
+        "m",
+        "miniti"
+    ],
+    "second": [
+        "s",
+        "sekoni"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "'ahó ni",
+            "'ani"
+        ],
+        "0 hour ago": [
+            "ko e houa 'eni",
+            "this hour"
+        ],
+        "0 minute ago": [
+            "ko e miniti 'eni",
+            "this minute"
+        ],
+        "0 month ago": [
+            "mhni",
+            "māhiná ni"
+        ],
+        "0 second ago": [
+            "taimí ni"
+        ],
+        "0 week ago": [
+            "uiké ni",
+            "uini"
+        ],
+        "0 year ago": [
+            "ta'ú ni",
+            "tni"
+        ],
+        "1 day ago": [
+            "'ane",
+            "'aneafi"
+        ],
+        "1 month ago": [
+            "mh'osi",
+            "māhina kuo'osi"
+        ],
+        "1 week ago": [
+            "ui'osi",
+            "uike kuo'osi"
+        ],
+        "1 year ago": [
+            "t'osi",
+            "ta'u kuo'osi"
+        ],
+        "in 1 day": [
+            "'apo",
+            "'apongipongi"
+        ],
+        "in 1 month": [
+            "mhha'u",
+            "māhina kaha'u"
+        ],
+        "in 1 week": [
+            "uiha'u",
+            "uike kaha'u"
+        ],
+        "in 1 year": [
+            "ta'u kaha'u",
+            "tha'u"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "'aho 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 hour ago": [
+            "houa 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 minute ago": [
+            "miniti 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 month ago": [
+            "māhina 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 second ago": [
+            "sekoni 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 week ago": [
+            "uike 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "\\1 year ago": [
+            "ta'u 'e (\\d++[.,]?\\d*+) kuo'osi"
+        ],
+        "in \\1 day": [
+            "'i he 'aho 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 hour": [
+            "'i he houa 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 minute": [
+            "'i he miniti 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 month": [
+            "'i he māhina 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 second": [
+            "'i he sekoni 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 week": [
+            "'i he uike 'e (\\d++[.,]?\\d*+)"
+        ],
+        "in \\1 year": [
+            "'i he ta'u 'e (\\d++[.,]?\\d*+)"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
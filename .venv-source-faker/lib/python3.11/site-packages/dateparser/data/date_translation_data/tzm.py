@@ -0,0 +1,170 @@
+info = {
+    "name": "tzm",
+    "date_order": "DMY",
+    "january": [
+        "yen",
+        "yennayer"
+    ],
+    "february": [
+        "yeb",
+        "yebrayer"
+    ],
+    "march": [
+        "mar",
+        "mars"
+    ],
+    "april": [
+        "ibr",
+        "ibrir"
+    ],
+    "may": [
+        "may",
+        "mayyu"
+    ],
+    "june": [
+        "yun",
+        "yunyu"
+    ],
+    "july": [
+        "yul",
+        "yulyuz"
+    ],
+    "august": [
+        "ɣuc",
+        "ɣuct"
+    ],
+    "september": [
+        "cut",
+        "cutanbir"
+    ],
+    "october": [
+        "kṭu",
+        "kṭuber"
+    ],
+    "november": [
+        "nwa",
+        "nwanbir"
+    ],
+    "december": [
+        "duj",
+        "dujanbir"
+    ],
+    "monday": [
+        "ayn",
+        "aynas"
+    ],
+    "tuesday": [
+        "asinas",
+        "asn"
+    ],
+    "wednesday": [
+        "akr",
+        "akras"
+    ],
+    "thursday": [
+        "akw",
+        "akwas"
+    ],
+    "friday": [
+        "asimwas",
+        "asm"
+    ],
+    "saturday": [
+        "asiḍyas",
+        "asḍ"
+    ],
+    "sunday": [
+        "asa",
+        "asamas"
+    ],
+    "am": [
+        "zdat azal"
+    ],
+    "pm": [
+        "ḍeffir aza"
+    ],
+    "year": [
+        "asseggas"
+    ],
+    "month": [
+        "ayur"
+    ],
+    "week": [
+        "imalass"
+    ],
+    "day": [
+        "ass"
+    ],
+    "hour": [
+        "hr",
+        "tasragt"
+    ],
+    "minute": [
+        "tusdat"
+    ],
+    "second": [
+        "tusnat"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "assa"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "assenaṭ"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "asekka"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
@@ -0,0 +1,168 @@
+info = {
+    "name": "uz-Arab",
+    "date_order": "YMD",
+    "january": [
+        "جنو",
+        "جنوری"
+    ],
+    "february": [
+        "فبر",
+        "فبروری"
+    ],
+    "march": [
+        "مار",
+        "مارچ"
+    ],
+    "april": [
+        "اپر",
+        "اپریل"
+    ],
+    "may": [
+        "می"
+    ],
+    "june": [
+        "جون"
+    ],
+    "july": [
+        "جول",
+        "جولای"
+    ],
+    "august": [
+        "اگس",
+        "اگست"
+    ],
+    "september": [
+        "سپت",
+        "سپتمبر"
+    ],
+    "october": [
+        "اکت",
+        "اکتوبر"
+    ],
+    "november": [
+        "نوم",
+        "نومبر"
+    ],
+    "december": [
+        "دسم",
+        "دسمبر"
+    ],
+    "monday": [
+        "د",
+        "دوشنبه"
+    ],
+    "tuesday": [
+        "س",
+        "سه‌شنبه"
+    ],
+    "wednesday": [
+        "چ",
+        "چهارشنبه"
+    ],
+    "thursday": [
+        "پ",
+        "پنجشنبه"
+    ],
+    "friday": [
+        "ج",
+        "جمعه"
+    ],
+    "saturday": [
+        "ش",
+        "شنبه"
+    ],
+    "sunday": [
+        "ی",
+        "یکشنبه"
+    ],
+    "am": [
+        "am"
+    ],
+    "pm": [
+        "pm"
+    ],
+    "year": [
+        "year"
+    ],
+    "month": [
+        "month"
+    ],
+    "week": [
+        "week"
+    ],
+    "day": [
+        "day"
+    ],
+    "hour": [
+        "hour",
+        "hr"
+    ],
+    "minute": [
+        "minute"
+    ],
+    "second": [
+        "second"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "today"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "this week"
+        ],
+        "0 year ago": [
+            "this year"
+        ],
+        "1 day ago": [
+            "yesterday"
+        ],
+        "1 month ago": [
+            "last month"
+        ],
+        "1 week ago": [
+            "last week"
+        ],
+        "1 year ago": [
+            "last year"
+        ],
+        "in 1 day": [
+            "tomorrow"
+        ],
+        "in 1 month": [
+            "next month"
+        ],
+        "in 1 week": [
+            "next week"
+        ],
+        "in 1 year": [
+            "next year"
+        ]
+    },
+    "locale_specific": {},
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
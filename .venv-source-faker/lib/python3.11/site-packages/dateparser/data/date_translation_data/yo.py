@@ -0,0 +1,358 @@
+info = {
+    "name": "yo",
+    "date_order": "DMY",
+    "january": [
+        "oṣù ṣẹ́rẹ́",
+        "ṣẹ́",
+        "ṣẹ́r",
+        "ṣẹ́rẹ́"
+    ],
+    "february": [
+        "oṣù èrèlè",
+        "èr",
+        "èrèl",
+        "èrèlè"
+    ],
+    "march": [
+        "oṣù ẹrẹ̀nà",
+        "ẹr",
+        "ẹrẹ̀n",
+        "ẹrẹ̀nà"
+    ],
+    "april": [
+        "oṣù ìgbé",
+        "ìg",
+        "ìgb",
+        "ìgbé"
+    ],
+    "may": [
+        "oṣù ẹ̀bibi",
+        "ẹ̀b",
+        "ẹ̀bi",
+        "ẹ̀bibi"
+    ],
+    "june": [
+        "oṣù òkúdu",
+        "òk",
+        "òkú",
+        "òkúdu"
+    ],
+    "july": [
+        "ag",
+        "agẹ",
+        "agẹmọ",
+        "oṣù agẹmọ"
+    ],
+    "august": [
+        "oṣù ògún",
+        "òg",
+        "ògú",
+        "ògún"
+    ],
+    "september": [
+        "ow",
+        "owe",
+        "owewe",
+        "oṣù owewe"
+    ],
+    "october": [
+        "oṣù ọ̀wàrà",
+        "ọ̀w",
+        "ọ̀wà",
+        "ọ̀wàrà"
+    ],
+    "november": [
+        "bé",
+        "bél",
+        "bélú",
+        "oṣù bélú"
+    ],
+    "december": [
+        "oṣù ọ̀pẹ̀",
+        "ọ̀p",
+        "ọ̀pẹ",
+        "ọ̀pẹ̀"
+    ],
+    "monday": [
+        "aj",
+        "ajé",
+        "ọjọ́ ajé"
+    ],
+    "tuesday": [
+        "ìsẹ́g",
+        "ìsẹ́gun",
+        "ọjọ́ ìsẹ́gun"
+    ],
+    "wednesday": [
+        "ọjọ́r",
+        "ọjọ́rú"
+    ],
+    "thursday": [
+        "ọjọ́b",
+        "ọjọ́bọ"
+    ],
+    "friday": [
+        "ẹt",
+        "ẹtì",
+        "ọjọ́ ẹtì"
+    ],
+    "saturday": [
+        "àbám",
+        "àbámẹ́ta",
+        "ọjọ́ àbámẹ́ta"
+    ],
+    "sunday": [
+        "àìk",
+        "àìkú",
+        "ọjọ́ àìkú"
+    ],
+    "am": [
+        "àárọ̀"
+    ],
+    "pm": [
+        "ọ̀sán"
+    ],
+    "year": [
+        "ọdún"
+    ],
+    "month": [
+        "osù",
+        "oṣù"
+    ],
+    "week": [
+        "ọ̀sẹ̀",
+        "ọ̀sè"
+    ],
+    "day": [
+        "ọjọ́"
+    ],
+    "hour": [
+        "wkt",
+        "wákàtí"
+    ],
+    "minute": [
+        "ìsẹ́jú"
+    ],
+    "second": [
+        "ìsẹ́jú ààyá"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "òní"
+        ],
+        "0 hour ago": [
+            "this hour"
+        ],
+        "0 minute ago": [
+            "this minute"
+        ],
+        "0 month ago": [
+            "oṣù yìí",
+            "this month"
+        ],
+        "0 second ago": [
+            "now"
+        ],
+        "0 week ago": [
+            "ọ̀sẹ̀ yìí",
+            "this week"
+        ],
+        "0 year ago": [
+            "ọdún yìí",
+            "ọdúnǹí",
+            "this year"
+        ],
+        "1 day ago": [
+            "àná"
+        ],
+        "1 month ago": [
+            "óṣù tó kọjá",
+            "last month"
+        ],
+        "1 week ago": [
+            "ọ̀sẹ̀ tó kọjá",
+            "last week"
+        ],
+        "1 year ago": [
+            "èṣín",
+            "ọdún tó kọjá",
+            "last year"
+        ],
+        "in 1 day": [
+            "ọ̀la"
+        ],
+        "in 1 month": [
+            "óṣù tó ń bọ̀,",
+            "next month"
+        ],
+        "in 1 week": [
+            "ọ́sẹ̀ tó ń bọ̀",
+            "next week"
+        ],
+        "in 1 year": [
+            "àmọ́dún",
+            "ọdún tó ńbọ̀",
+            "next year"
+        ]
+    },
+    "locale_specific": {
+        "yo-BJ": {
+            "name": "yo-BJ",
+            "january": [
+                "oshù shɛ́rɛ́",
+                "shɛ́",
+                "shɛ́r",
+                "shɛ́rɛ́"
+            ],
+            "february": [
+                "oshù èrèlè"
+            ],
+            "march": [
+                "oshù ɛrɛ̀nà",
+                "ɛr",
+                "ɛrɛ̀n",
+                "ɛrɛ̀nà"
+            ],
+            "april": [
+                "oshù ìgbé"
+            ],
+            "may": [
+                "oshù ɛ̀bibi",
+                "ɛ̀b",
+                "ɛ̀bi",
+                "ɛ̀bibi"
+            ],
+            "june": [
+                "oshù òkúdu"
+            ],
+            "july": [
+                "agɛ",
+                "agɛmɔ",
+                "oshù agɛmɔ"
+            ],
+            "august": [
+                "oshù ògún"
+            ],
+            "september": [
+                "oshù owewe"
+            ],
+            "october": [
+                "oshù ɔ̀wàrà",
+                "ɔ̀w",
+                "ɔ̀wà",
+                "ɔ̀wàrà"
+            ],
+            "november": [
+                "oshù bélú"
+            ],
+            "december": [
+                "oshù ɔ̀pɛ̀",
+                "ɔ̀p",
+                "ɔ̀pɛ",
+                "ɔ̀pɛ̀"
+            ],
+            "monday": [
+                "ɔjɔ́ ajé"
+            ],
+            "tuesday": [
+                "ìsɛ́g",
+                "ìsɛ́gun",
+                "ɔjɔ́ ìsɛ́gun"
+            ],
+            "wednesday": [
+                "ɔjɔ́r",
+                "ɔjɔ́rú"
+            ],
+            "thursday": [
+                "ɔjɔ́b",
+                "ɔjɔ́bɔ"
+            ],
+            "friday": [
+                "ɔjɔ́ ɛtì",
+                "ɛt",
+                "ɛtì"
+            ],
+            "saturday": [
+                "àbámɛ́ta",
+                "ɔjɔ́ àbámɛ́ta"
+            ],
+            "sunday": [
+                "ɔjɔ́ àìkú"
+            ],
+            "am": [
+                "àárɔ̀"
+            ],
+            "pm": [
+                "ɔ̀sán"
+            ],
+            "year": [
+                "ɔdún"
+            ],
+            "month": [
+                "oshù"
+            ],
+            "week": [
+                "ɔ̀sɛ̀",
+                "ɔ̀sè"
+            ],
+            "day": [
+                "ɔjɔ́"
+            ],
+            "minute": [
+                "ìsɛ́jú"
+            ],
+            "second": [
+                "ìsɛ́jú ààyá"
+            ],
+            "relative-type": {
+                "0 month ago": [
+                    "oshù yìí"
+                ],
+                "0 week ago": [
+                    "ɔ̀sɛ̀ yìí"
+                ],
+                "0 year ago": [
+                    "ɔdún yìí",
+                    "ɔdúnǹí"
+                ],
+                "1 month ago": [
+                    "óshù tó kɔjá"
+                ],
+                "1 week ago": [
+                    "ɔ̀sɛ̀ tó kɔjá"
+                ],
+                "1 year ago": [
+                    "èshín",
+                    "ɔdún tó kɔjá"
+                ],
+                "in 1 day": [
+                    "ɔ̀la"
+                ],
+                "in 1 month": [
+                    "óshù tó ń bɔ̀,"
+                ],
+                "in 1 week": [
+                    "ɔ́sɛ̀ tó ń bɔ̀"
+                ],
+                "in 1 year": [
+                    "àmɔ́dún",
+                    "ɔdún tó ńbɔ̀"
+                ]
+            }
+        }
+    },
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
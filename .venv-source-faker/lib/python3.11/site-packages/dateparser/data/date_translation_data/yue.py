@@ -0,0 +1,203 @@
+info = {
+    "name": "yue",
+    "date_order": "YMD",
+    "january": [
+        "1月"
+    ],
+    "february": [
+        "2月"
+    ],
+    "march": [
+        "3月"
+    ],
+    "april": [
+        "4月"
+    ],
+    "may": [
+        "5月"
+    ],
+    "june": [
+        "6月"
+    ],
+    "july": [
+        "7月"
+    ],
+    "august": [
+        "8月"
+    ],
+    "september": [
+        "9月"
+    ],
+    "october": [
+        "10月"
+    ],
+    "november": [
+        "11月"
+    ],
+    "december": [
+        "12月"
+    ],
+    "monday": [
+        "星期一",
+        "週一"
+    ],
+    "tuesday": [
+        "星期二",
+        "週二"
+    ],
+    "wednesday": [
+        "星期三",
+        "週三"
+    ],
+    "thursday": [
+        "星期四",
+        "週四"
+    ],
+    "friday": [
+        "星期五",
+        "週五"
+    ],
+    "saturday": [
+        "星期六",
+        "週六"
+    ],
+    "sunday": [
+        "星期日",
+        "週日"
+    ],
+    "am": [
+        "上午"
+    ],
+    "pm": [
+        "下午"
+    ],
+    "year": [
+        "年"
+    ],
+    "month": [
+        "月"
+    ],
+    "week": [
+        "週"
+    ],
+    "day": [
+        "日"
+    ],
+    "hour": [
+        "小時"
+    ],
+    "minute": [
+        "分鐘"
+    ],
+    "second": [
+        "秒"
+    ],
+    "relative-type": {
+        "0 day ago": [
+            "今日"
+        ],
+        "0 hour ago": [
+            "呢個小時"
+        ],
+        "0 minute ago": [
+            "呢分鐘"
+        ],
+        "0 month ago": [
+            "今個月"
+        ],
+        "0 second ago": [
+            "宜家"
+        ],
+        "0 week ago": [
+            "今個星期"
+        ],
+        "0 year ago": [
+            "今年"
+        ],
+        "1 day ago": [
+            "尋日"
+        ],
+        "1 month ago": [
+            "上個月"
+        ],
+        "1 week ago": [
+            "上星期"
+        ],
+        "1 year ago": [
+            "舊年"
+        ],
+        "in 1 day": [
+            "聽日"
+        ],
+        "in 1 month": [
+            "下個月"
+        ],
+        "in 1 week": [
+            "下星期"
+        ],
+        "in 1 year": [
+            "下年"
+        ]
+    },
+    "relative-type-regex": {
+        "\\1 day ago": [
+            "(\\d++[.,]?\\d*+) 日前"
+        ],
+        "\\1 hour ago": [
+            "(\\d++[.,]?\\d*+) 小時前"
+        ],
+        "\\1 minute ago": [
+            "(\\d++[.,]?\\d*+) 分鐘前"
+        ],
+        "\\1 month ago": [
+            "(\\d++[.,]?\\d*+) 個月前"
+        ],
+        "\\1 second ago": [
+            "(\\d++[.,]?\\d*+) 秒前"
+        ],
+        "\\1 week ago": [
+            "(\\d++[.,]?\\d*+) 個星期前"
+        ],
+        "\\1 year ago": [
+            "(\\d++[.,]?\\d*+) 年前"
+        ],
+        "in \\1 day": [
+            "(\\d++[.,]?\\d*+) 日後"
+        ],
+        "in \\1 hour": [
+            "(\\d++[.,]?\\d*+) 小時後"
+        ],
+        "in \\1 minute": [
+            "(\\d++[.,]?\\d*+) 分鐘後"
+        ],
+        "in \\1 month": [
+            "(\\d++[.,]?\\d*+) 個月後"
+        ],
+        "in \\1 second": [
+            "(\\d++[.,]?\\d*+) 秒後"
+        ],
+        "in \\1 week": [
+            "(\\d++[.,]?\\d*+) 個星期後"
+        ],
+        "in \\1 year": [
+            "(\\d++[.,]?\\d*+) 年後"
+        ]
+    },
+    "locale_specific": {},
+    "no_word_spacing": "True",
+    "sentence_splitter_group": 4,
+    "skip": [
+        " ",
+        "'",
+        ",",
+        "-",
+        ".",
+        "/",
+        ";",
+        "@",
+        "[",
+        "]",
+        "|",
+        "，"
+    ]
+}
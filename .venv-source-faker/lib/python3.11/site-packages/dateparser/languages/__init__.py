@@ -0,0 +1,2 @@
+from .loader import default_loader
+from .locale import Locale
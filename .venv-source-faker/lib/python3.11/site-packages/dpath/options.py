@@ -0,0 +1 @@
+ALLOW_EMPTY_STRING_KEYS = False
@@ -0,0 +1 @@
+VERSION = "2.2.0"
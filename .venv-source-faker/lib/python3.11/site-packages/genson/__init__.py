@@ -0,0 +1,12 @@
+from .schema.builder import SchemaBuilder, Schema
+from .schema.node import SchemaNode, SchemaGenerationError
+from .schema.strategies.base import SchemaStrategy, TypedSchemaStrategy
+
+__version__ = '1.3.0'
+__all__ = [
+    'SchemaBuilder',
+    'SchemaNode',
+    'SchemaGenerationError',
+    'Schema',
+    'SchemaStrategy',
+    'TypedSchemaStrategy']
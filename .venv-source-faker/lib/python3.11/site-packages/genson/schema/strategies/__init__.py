@@ -0,0 +1,37 @@
+from .base import (
+    SchemaStrategy,
+    TypedSchemaStrategy
+)
+from .scalar import (
+    Typeless,
+    Null,
+    Boolean,
+    Number,
+    String
+)
+from .array import List, Tuple
+from .object import Object
+
+BASIC_SCHEMA_STRATEGIES = (
+    Null,
+    Boolean,
+    Number,
+    String,
+    List,
+    Tuple,
+    Object
+)
+
+__all__ = (
+    'SchemaStrategy',
+    'TypedSchemaStrategy',
+    'Null',
+    'Boolean',
+    'Number',
+    'String',
+    'List',
+    'Tuple',
+    'Object',
+    'Typeless',
+    'BASIC_SCHEMA_STRATEGIES'
+)
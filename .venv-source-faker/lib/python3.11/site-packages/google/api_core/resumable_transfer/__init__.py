@@ -0,0 +1,49 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resumable transfer library for Google APIs."""
+
+from google.api_core.exceptions import (
+    MissingStatusHeaderError,
+    ResumableTransferError,
+    TransferStalledError,
+    UnseekableStreamError,
+    UploadCancelledError,
+)
+from google.api_core.resumable_transfer.common import (
+    DEFAULT_CHUNK_SIZE,
+    ProgressState,
+    ResumableUploadConfig,
+    UploadProgress,
+)
+from google.api_core.resumable_transfer.upload import ResumableUploadSession
+from google.api_core.resumable_transfer.upload_async import (
+    AsyncResumableUploadSession,
+    AsyncUploadOperation,
+)
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "MissingStatusHeaderError",
+    "ProgressState",
+    "ResumableTransferError",
+    "TransferStalledError",
+    "UnseekableStreamError",
+    "UploadCancelledError",
+    "UploadProgress",
+    "ResumableUploadConfig",
+    "ResumableUploadSession",
+    "AsyncResumableUploadSession",
+    "AsyncUploadOperation",
+]
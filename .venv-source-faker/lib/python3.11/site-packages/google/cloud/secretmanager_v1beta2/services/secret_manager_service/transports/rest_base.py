@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json  # type: ignore
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import google.iam.v1.iam_policy_pb2 as iam_policy_pb2  # type: ignore
+import google.iam.v1.policy_pb2 as policy_pb2  # type: ignore
+import google.protobuf.empty_pb2 as empty_pb2  # type: ignore
+from google.api_core import gapic_v1, path_template
+from google.cloud.location import locations_pb2  # type: ignore
+from google.protobuf import json_format
+
+from google.cloud.secretmanager_v1beta2.types import resources, service
+
+from .base import DEFAULT_CLIENT_INFO, SecretManagerServiceTransport
+
+
+class _BaseSecretManagerServiceRestTransport(SecretManagerServiceTransport):
+    """Base REST backend transport for SecretManagerService.
+
+    Note: This class is not meant to be used directly. Use its sync and
+    async sub-classes instead.
+
+    This class defines the same methods as the primary client, so the
+    primary client can load the underlying transport implementation
+    and call it.
+
+    It sends JSON representations of protocol buffers over HTTP/1.1
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "secretmanager.googleapis.com",
+        credentials: Optional[Any] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        always_use_jwt_access: Optional[bool] = False,
+        url_scheme: str = "https",
+        api_audience: Optional[str] = None,
+    ) -> None:
+        """Instantiate the transport.
+        Args:
+            host (Optional[str]):
+                 The hostname to connect to (default: 'secretmanager.googleapis.com').
+            credentials (Optional[Any]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info used to send a user-agent string along with
+                API requests. If ``None``, then default info will be used.
+                Generally, you only need to set this if you are developing
+                your own client library.
+            always_use_jwt_access (Optional[bool]): Whether self signed JWT should
+                be used for service account credentials.
+            url_scheme: the protocol scheme for the API endpoint.  Normally
+                "https", but for testing or local servers,
+                "http" can be specified.
+        """
+        # Run the base constructor
+        maybe_url_match = re.match("^(?P<scheme>http(?:s)?://)?(?P<host>.*)$", host)
+        if maybe_url_match is None:
+            raise ValueError(
+                f"Unexpected hostname structure: {host}"
+            )  # pragma: NO COVER
+
+        url_match_items = maybe_url_match.groupdict()
+
+        host = f"{url_scheme}://{host}" if not url_match_items["scheme"] else host
+
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            client_info=client_info,
+            always_use_jwt_access=always_use_jwt_access,
+            api_audience=api_audience,
+        )
+
+    class _BaseAccessSecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*/versions/*}:access",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*/versions/*}:access",
+                },
+            ]
+            return http_options
+
+    class _BaseAddSecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{parent=projects/*/secrets/*}:addVersion",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{parent=projects/*/locations/*/secrets/*}:addVersion",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseCreateSecret:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {
+            "secretId": "",
+        }
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{parent=projects/*}/secrets",
+                    "body": "secret",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{parent=projects/*/locations/*}/secrets",
+                    "body": "secret",
+                },
+            ]
+            return http_options
+
+    class _BaseDeleteSecret:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "delete",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*}",
+                },
+                {
+                    "method": "delete",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*}",
+                },
+            ]
+            return http_options
+
+    class _BaseDestroySecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*/versions/*}:destroy",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*/versions/*}:destroy",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseDisableSecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*/versions/*}:disable",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*/versions/*}:disable",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseEnableSecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*/versions/*}:enable",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*/versions/*}:enable",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseGetIamPolicy:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{resource=projects/*/secrets/*}:getIamPolicy",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{resource=projects/*/locations/*/secrets/*}:getIamPolicy",
+                },
+            ]
+            return http_options
+
+    class _BaseGetSecret:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*}",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*}",
+                },
+            ]
+            return http_options
+
+    class _BaseGetSecretVersion:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/secrets/*/versions/*}",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/locations/*/secrets/*/versions/*}",
+                },
+            ]
+            return http_options
+
+    class _BaseListSecrets:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{parent=projects/*}/secrets",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{parent=projects/*/locations/*}/secrets",
+                },
+            ]
+            return http_options
+
+    class _BaseListSecretVersions:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{parent=projects/*/secrets/*}/versions",
+                },
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{parent=projects/*/locations/*/secrets/*}/versions",
+                },
+            ]
+            return http_options
+
+    class _BaseSetIamPolicy:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{resource=projects/*/secrets/*}:setIamPolicy",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{resource=projects/*/locations/*/secrets/*}:setIamPolicy",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseTestIamPermissions:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{resource=projects/*/secrets/*}:testIamPermissions",
+                    "body": "*",
+                },
+                {
+                    "method": "post",
+                    "uri": "/v1beta2/{resource=projects/*/locations/*/secrets/*}:testIamPermissions",
+                    "body": "*",
+                },
+            ]
+            return http_options
+
+    class _BaseUpdateSecret:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {
+            "updateMask": {},
+        }
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "patch",
+                    "uri": "/v1beta2/{secret.name=projects/*/secrets/*}",
+                    "body": "secret",
+                },
+                {
+                    "method": "patch",
+                    "uri": "/v1beta2/{secret.name=projects/*/locations/*/secrets/*}",
+                    "body": "secret",
+                },
+            ]
+            return http_options
+
+    class _BaseGetLocation:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*/locations/*}",
+                },
+            ]
+            return http_options
+
+    class _BaseListLocations:
+        def __hash__(self):  # pragma: NO COVER
+            return NotImplementedError("__hash__ must be implemented.")
+
+        @staticmethod
+        def _get_http_options():
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1beta2/{name=projects/*}/locations",
+                },
+            ]
+            return http_options
+
+
+__all__ = ("_BaseSecretManagerServiceRestTransport",)
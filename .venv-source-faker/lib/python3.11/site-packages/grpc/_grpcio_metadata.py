@@ -0,0 +1 @@
+__version__ = """1.84.0"""
\ No newline at end of file
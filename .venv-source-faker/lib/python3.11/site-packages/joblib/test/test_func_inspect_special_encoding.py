@@ -0,0 +1,9 @@
+# -*- coding: big5 -*-
+
+
+# Some Traditional Chinese characters: @Ǥr
+def big5_f():
+    """Ωժ
+    """
+    # 
+    return 0
@@ -0,0 +1,15 @@
+from importlib import metadata
+
+from langchain_core._api import (
+    surface_langchain_beta_warnings,
+    surface_langchain_deprecation_warnings,
+)
+
+try:
+    __version__ = metadata.version(__package__)
+except metadata.PackageNotFoundError:
+    # Case where package metadata is not available.
+    __version__ = ""
+
+surface_langchain_deprecation_warnings()
+surface_langchain_beta_warnings()
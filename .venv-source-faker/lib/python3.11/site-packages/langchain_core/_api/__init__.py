@@ -0,0 +1,38 @@
+"""Helper functions for managing the LangChain API.
+
+This module is only relevant for LangChain developers, not for users.
+
+.. warning::
+
+    This module and its submodules are for internal use only.  Do not use them
+    in your own code.  We may change the API at any time with no warning.
+
+"""
+from .beta_decorator import (
+    LangChainBetaWarning,
+    beta,
+    suppress_langchain_beta_warning,
+    surface_langchain_beta_warnings,
+)
+from .deprecation import (
+    LangChainDeprecationWarning,
+    deprecated,
+    suppress_langchain_deprecation_warning,
+    surface_langchain_deprecation_warnings,
+    warn_deprecated,
+)
+from .path import as_import_path, get_relative_path
+
+__all__ = [
+    "as_import_path",
+    "beta",
+    "deprecated",
+    "get_relative_path",
+    "LangChainBetaWarning",
+    "LangChainDeprecationWarning",
+    "suppress_langchain_beta_warning",
+    "surface_langchain_beta_warnings",
+    "suppress_langchain_deprecation_warning",
+    "surface_langchain_deprecation_warnings",
+    "warn_deprecated",
+]
@@ -0,0 +1 @@
+"""Some **beta** features that are not yet ready for production."""
@@ -0,0 +1,10 @@
+from langchain_core.document_loaders.base import BaseBlobParser, BaseLoader
+from langchain_core.document_loaders.blob_loaders import Blob, BlobLoader, PathLike
+
+__all__ = [
+    "BaseBlobParser",
+    "BaseLoader",
+    "Blob",
+    "BlobLoader",
+    "PathLike",
+]
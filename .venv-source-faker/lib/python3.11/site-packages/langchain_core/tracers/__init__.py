@@ -0,0 +1,31 @@
+"""**Tracers** are classes for tracing runs.
+
+**Class hierarchy:**
+
+.. code-block::
+
+    BaseCallbackHandler --> BaseTracer --> <name>Tracer  # Examples: LangChainTracer, RootListenersTracer
+                                       --> <name>  # Examples: LogStreamCallbackHandler
+"""  # noqa: E501
+
+__all__ = [
+    "BaseTracer",
+    "EvaluatorCallbackHandler",
+    "LangChainTracer",
+    "ConsoleCallbackHandler",
+    "Run",
+    "RunLog",
+    "RunLogPatch",
+    "LogStreamCallbackHandler",
+]
+
+from langchain_core.tracers.base import BaseTracer
+from langchain_core.tracers.evaluation import EvaluatorCallbackHandler
+from langchain_core.tracers.langchain import LangChainTracer
+from langchain_core.tracers.log_stream import (
+    LogStreamCallbackHandler,
+    RunLog,
+    RunLogPatch,
+)
+from langchain_core.tracers.schemas import Run
+from langchain_core.tracers.stdout import ConsoleCallbackHandler
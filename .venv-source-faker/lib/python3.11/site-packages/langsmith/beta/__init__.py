@@ -0,0 +1,6 @@
+"""Beta functionality prone to change."""
+
+from langsmith._internal._beta_decorator import warn_beta
+from langsmith.beta._evals import compute_test_metrics, convert_runs_to_test
+
+__all__ = ["convert_runs_to_test", "compute_test_metrics", "warn_beta"]
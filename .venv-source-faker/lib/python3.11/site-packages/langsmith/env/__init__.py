@@ -0,0 +1,30 @@
+"""Utilities to get information about the runtime environment."""
+from langsmith.env._git import get_git_info
+from langsmith.env._runtime_env import (
+    get_docker_compose_command,
+    get_docker_compose_version,
+    get_docker_environment,
+    get_docker_version,
+    get_langchain_env_var_metadata,
+    get_langchain_env_vars,
+    get_langchain_environment,
+    get_release_shas,
+    get_runtime_and_metrics,
+    get_runtime_environment,
+    get_system_metrics,
+)
+
+__all__ = [
+    "get_docker_compose_command",
+    "get_docker_compose_version",
+    "get_docker_environment",
+    "get_docker_version",
+    "get_langchain_env_var_metadata",
+    "get_langchain_env_vars",
+    "get_langchain_environment",
+    "get_release_shas",
+    "get_runtime_and_metrics",
+    "get_runtime_environment",
+    "get_system_metrics",
+    "get_git_info",
+]
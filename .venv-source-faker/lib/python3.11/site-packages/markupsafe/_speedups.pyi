@@ -0,0 +1 @@
+def _escape_inner(s: str, /) -> str: ...
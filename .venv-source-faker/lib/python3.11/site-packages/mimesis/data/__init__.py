@@ -0,0 +1,15 @@
+from .int.address import *
+from .int.code import *
+from .int.common import *
+from .int.datetime import *
+from .int.development import *
+from .int.file import *
+from .int.finance import *
+from .int.hardware import *
+from .int.internet import *
+from .int.path import *
+from .int.payment import *
+from .int.person import *
+from .int.scientific import *
+from .int.text import *
+from .int.transport import *
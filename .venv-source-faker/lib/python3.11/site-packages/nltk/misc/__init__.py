@@ -0,0 +1,11 @@
+# Natural Language Toolkit: Miscellaneous modules
+#
+# Copyright (C) 2001-2024 NLTK Project
+# Author: Steven Bird <stevenbird1@gmail.com>
+# URL: <https://www.nltk.org/>
+# For license information, see LICENSE.TXT
+
+from nltk.misc.babelfish import babelize_shell
+from nltk.misc.chomsky import generate_chomsky
+from nltk.misc.minimalset import MinimalSet
+from nltk.misc.wordfinder import word_finder
@@ -0,0 +1,4 @@
+def setup_module():
+    import pytest
+
+    pytest.importorskip("gensim")
@@ -0,0 +1,3 @@
+from numpy import memmap as memmap
+
+__all__: list[str]
@@ -0,0 +1 @@
+int test_flags;
@@ -0,0 +1 @@
+from numpy.version import version
@@ -0,0 +1,8 @@
+
+version = "1.26.4"
+__version__ = version
+full_version = version
+
+git_revision = "9815c16f449e12915ef35a8255329ba26dacd5c0"
+release = 'dev' not in version and '+' not in version
+short_version = version.split("+")[0]